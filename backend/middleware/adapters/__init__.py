@@ -3,11 +3,30 @@ Adapters layer — ERP integration abstraction.
 
 Provides a common interface (ERPAdapter) so the core engine
 never depends on a specific ERP system.
+
+Concrete adapters are imported lazily (PEP 562) so that importing this
+package does not pull in the HTTP client stack used by the SAP adapters
+when only the mock adapter is needed.
 """
 
+import importlib
+from typing import Any
+
 from .base import ERPAdapter
-from .mock_adapter import MockERPAdapter
-from .sap_adapter import SAPERPAdapter
-from .hybrid_adapter import HybridERPAdapter
+
+# Public adapter name → submodule that defines it
+_LAZY_ADAPTERS: dict[str, str] = {
+    "MockERPAdapter": "mock_adapter",
+    "SAPERPAdapter": "sap_adapter",
+    "HybridERPAdapter": "hybrid_adapter",
+}
 
 __all__ = ["ERPAdapter", "MockERPAdapter", "SAPERPAdapter", "HybridERPAdapter"]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ADAPTERS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{module_name}", __name__)
+    return getattr(module, name)
@@ -1,17 +1,25 @@
 """
-ERPAdapter — Abstract base class for ERP integrations.
+ERPAdapter — Port interface (typing.Protocol) for ERP integrations.
 
 Every ERP connector (SAP, Oracle, Mock, etc.) must implement this interface.
 The core engine and services layer depend ONLY on this abstraction.
+
+Concrete adapters still subclass ``ERPAdapter`` explicitly so they inherit
+the default ``iter_pending_requisitions`` / ``submit_approvals``
+implementations; conformance is checked by type checkers rather than by
+``@abstractmethod`` bookkeeping.
 """
 
-from abc import ABC, abstractmethod
-from typing import Any
+import logging
+from collections.abc import Iterator
+from typing import Any, Protocol
 
 from models.domain import RequisitionDTO
 
+logger = logging.getLogger(__name__)
+
 
-class ERPAdapter(ABC):
+class ERPAdapter(Protocol):
     """
     Port interface for ERP system communication.
 
@@ -25,12 +33,10 @@ class ERPAdapter(ABC):
     # Lifecycle
     # ------------------------------------------------------------------
 
-    @abstractmethod
     def connect(self) -> None:
         """Establish connection to the ERP system."""
         ...
 
-    @abstractmethod
     def disconnect(self) -> None:
         """Clean up resources and close connection."""
         ...
@@ -39,7 +45,6 @@ class ERPAdapter(ABC):
     # Purchase Requisition Operations
     # ------------------------------------------------------------------
 
-    @abstractmethod
     def fetch_pending_requisitions(self, **filters: Any) -> list[RequisitionDTO]:
         """
         Retrieve purchase requisitions awaiting approval.
@@ -49,7 +54,16 @@ class ERPAdapter(ABC):
         """
         ...
 
-    @abstractmethod
+    def iter_pending_requisitions(self, **filters: Any) -> Iterator[RequisitionDTO]:
+        """
+        Stream pending requisitions one at a time.
+
+        The default simply walks ``fetch_pending_requisitions``; adapters
+        that can page through a large backlog override this to keep
+        memory bounded.
+        """
+        yield from self.fetch_pending_requisitions(**filters)
+
     def get_requisition_details(self, requisition_id: str) -> RequisitionDTO:
         """
         Fetch full details for a single requisition.
@@ -66,7 +80,6 @@ class ERPAdapter(ABC):
     # Approval Operations
     # ------------------------------------------------------------------
 
-    @abstractmethod
     def submit_approval(self, requisition_id: str, decision: str, comment: str = "") -> dict[str, Any]:
         """
         Push an approval / rejection decision back to the ERP.
@@ -81,11 +94,48 @@ class ERPAdapter(ABC):
         """
         ...
 
+    def submit_approvals(
+        self, items: list[tuple[str, str, str]],
+    ) -> list[dict[str, Any]]:
+        """
+        Push several decisions back to the ERP in one call.
+
+        The default submits each item through ``submit_approval``;
+        adapters that can amortise the round trip override this.  An item
+        that fails doesn't stop the rest — the ones before it are already
+        in the ERP — and is reported as ``{"status": "error", ...}``.
+
+        Args:
+            items: ``(requisition_id, decision, comment)`` tuples.
+
+        Returns:
+            One confirmation payload per item, in input order.
+        """
+        results: list[dict[str, Any]] = []
+        for requisition_id, decision, comment in items:
+            try:
+                results.append(
+                    self.submit_approval(requisition_id, decision, comment),
+                )
+            except Exception as exc:
+                logger.error(
+                    "ERP submission of %s for %s failed: %s",
+                    decision,
+                    requisition_id,
+                    exc,
+                )
+                results.append({
+                    "status": "error",
+                    "requisition_id": requisition_id,
+                    "decision": decision,
+                    "error": str(exc),
+                })
+        return results
+
     # ------------------------------------------------------------------
     # Health
     # ------------------------------------------------------------------
 
-    @abstractmethod
     def health_check(self) -> dict[str, Any]:
         """Return connectivity / health status."""
         ...
@@ -19,6 +19,14 @@ from models.domain import RequisitionDTO
 
 logger = logging.getLogger(__name__)
 
+# Invariant parts of the simulated write response
+_SIM_MSG_TMPL = (
+    "Decision '{decision}' for {requisition_id} simulated "
+    "(SAP Sandbox is read-only). In production, this would "
+    "call PurchaseRequisitionRelease OData action."
+)
+_SIM_BASE: dict[str, Any] = {"status": "ok", "simulated": True}
+
 
 class HybridERPAdapter(SAPERPAdapter):
     """
@@ -81,15 +89,11 @@ class HybridERPAdapter(SAPERPAdapter):
             requisition_id,
         )
 
-        return {
-            "status": "ok",
+        return _SIM_BASE | {
             "requisition_id": requisition_id,
             "decision": decision,
-            "simulated": True,
-            "message": (
-                f"Decision '{decision}' for {requisition_id} simulated "
-                f"(SAP Sandbox is read-only). In production, this would "
-                f"call PurchaseRequisitionRelease OData action."
+            "message": _SIM_MSG_TMPL.format(
+                decision=decision, requisition_id=requisition_id,
             ),
         }
 
@@ -8,6 +8,7 @@ Features:
     - Basic authentication with SAP credentials
     - CSRF token handling for write operations (POST/PATCH)
     - Configurable timeout per request
+    - Process-wide pooled HTTP session (keep-alive reuse across adapters)
     - Automatic retry with exponential backoff
     - Comprehensive error handling and logging
     - OData response parsing with field normalization
@@ -21,10 +22,14 @@ OData Endpoints:
 
 import logging
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any, Optional
+from typing import Any, Callable, Optional
+from urllib.parse import urlencode
 
+import orjson
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
@@ -68,6 +73,12 @@ _ODATA_FIELD_MAP: dict[str, str] = {
     "ItemNetAmount":                "total_amount",
 }
 
+# $select value for entity-set reads, joined once at import
+_SELECT_FIELDS = ",".join(_ODATA_FIELD_MAP)
+
+# Invariant query parameters for single-requisition detail reads
+_BASE_DETAIL_PARAMS: dict[str, str] = {"$format": "json", "$top": "1"}
+
 # Decision mapping → SAP release action codes
 _SAP_ACTION_MAP: dict[str, str] = {
     "approve":          "01",    # Release
@@ -81,7 +92,213 @@ _SAP_ACTION_MAP: dict[str, str] = {
 # Retry configuration
 _MAX_RETRIES = 3
 _BACKOFF_FACTOR = 0.5
-_RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+# urllib3's Retry takes sequences; keep them as ready-made tuples
+_RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+_RETRY_ALLOWED_METHODS = ("GET", "POST", "PATCH")
+
+# Pagination for fetch_pending_requisitions: rows per OData page and how
+# many follow-up pages may be in flight at once
+_PAGE_SIZE = 100
+_PAGE_WORKERS = 4
+
+# Unfiltered fetch_pending_requisitions (the scheduler's poll): the page
+# params never change, so the first-page query string is encoded once
+_DEFAULT_PENDING_PARAMS: dict[str, str] = {
+    "$format": "json",
+    "$top": str(_PAGE_SIZE),
+    "$select": _SELECT_FIELDS,
+    # Stable order so $skip pages neither overlap nor miss rows
+    "$orderby": "PurchaseRequisition,PurchaseRequisitionItem",
+}
+_DEFAULT_FIRST_PAGE_QS = urlencode(
+    {**_DEFAULT_PENDING_PARAMS, "$inlinecount": "allpages"},
+)
+
+# Methods that need the CSRF token header
+_WRITE_METHODS = frozenset({"POST", "PATCH", "PUT", "DELETE"})
+_CSRF_FETCH_HEADERS = {"X-CSRF-Token": "Fetch"}
+
+# Proactively re-fetch the CSRF token after this long (a 403 also triggers it)
+_CSRF_MAX_AGE_SECONDS = 30 * 60
+
+
+# ---------------------------------------------------------------------------
+# OData → RequisitionDTO field conversion
+# ---------------------------------------------------------------------------
+_UTC = timezone.utc
+_SAP_DATE_RE = re.compile(r"/Date\(([-]?\d+)")
+_SAP_TRUE_STRINGS = frozenset({"true", "x", "1"})
+
+
+def _as_is(value: Any) -> Any:
+    return value
+
+
+def _to_requisition_id(value: Any) -> str:
+    return str(value).strip() if value is not None else ""
+
+
+def _to_float(value: Any) -> float | None:
+    """Numeric OData value → float; None when missing or unparsable."""
+    if value is None:
+        return None
+    if type(value) is float:
+        return value
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _to_logged_float(label: str) -> Callable[[Any], float | None]:
+    """Like ``_to_float`` but logs values that fail to parse."""
+    def convert(value: Any) -> float | None:
+        result = _to_float(value)
+        if result is None and value is not None:
+            logger.warning("SAPERPAdapter: invalid %s value: %s", label, value)
+        return result
+    return convert
+
+
+def _to_bool(value: Any) -> bool:
+    """SAP flags arrive as bool or as "X" / "true" / "1" strings."""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        return value.lower() in _SAP_TRUE_STRINGS
+    return False
+
+
+def _parse_sap_date(value: Any) -> str | None:
+    """
+    Convert SAP OData date to ISO YYYY-MM-DD string.
+
+    SAP dates come as /Date(epoch_ms)/ or /Date(epoch_ms+offset)/.
+    Returns None for empty/null values.
+    """
+    if not value:
+        return None
+    s = str(value).strip()
+    if not s:
+        return None
+    # Match /Date(1471392000000)/ or /Date(1471392000000+0000)/
+    m = _SAP_DATE_RE.search(s)
+    if m:
+        epoch_ms = int(m.group(1))
+        dt = datetime.fromtimestamp(epoch_ms / 1000, tz=_UTC)
+        return dt.strftime("%Y-%m-%d")
+    # Already ISO format or other string — return as-is (truncated)
+    return s[:30]
+
+
+# (OData key, RequisitionDTO field, converter) applied to every row
+_FIELD_SPECS: tuple[tuple[str, str, Callable[[Any], Any]], ...] = (
+    ("PurchaseRequisition",         "erp_requisition_id", _to_requisition_id),
+    ("PurchaseRequisitionItem",     "item_number",        _as_is),
+    ("Material",                    "material",           _as_is),
+    ("PurchaseRequisitionItemText", "description",        _as_is),
+    ("RequestedQuantity",           "quantity",           _to_logged_float("quantity")),
+    ("BaseUnit",                    "unit",               _as_is),
+    ("PurchaseRequisitionPrice",    "price",              _to_logged_float("price")),
+    ("PurReqnItemCurrency",         "currency",           _as_is),
+    ("Plant",                       "plant",              _as_is),
+    ("MaterialGroup",               "material_group",     _as_is),
+    ("ItemNetAmount",               "total_amount",       _to_float),
+    ("CompanyCode",                 "company_code",       _as_is),
+    ("PurchasingGroup",             "purchasing_group",   _as_is),
+    ("CreatedByUser",               "created_by",         _as_is),
+    ("Supplier",                    "supplier",           _as_is),
+    ("PurReqnReleaseStatus",        "release_status",     _as_is),
+    ("ProcessingStatus",            "processing_status",  _as_is),
+    ("IsDeleted",                   "is_deleted",         _to_bool),
+    ("IsClosed",                    "is_closed",          _to_bool),
+    ("CreationDate",                "creation_date",      _parse_sap_date),
+    ("DeliveryDate",                "delivery_date",      _parse_sap_date),
+)
+
+
+def _odata_quote(value: str) -> str:
+    """Render *value* as an OData string literal (single quotes doubled)."""
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+_shared_session: Optional[requests.Session] = None
+_shared_session_lock = threading.Lock()
+
+
+def _get_shared_session() -> requests.Session:
+    """
+    Return the process-wide SAP HTTP session, building it on first use.
+
+    Every SAPERPAdapter / HybridERPAdapter instance shares one connection
+    pool, so reconnects, adapter switches and concurrent callers (request
+    threads and the commit worker) reuse warm TLS connections instead of
+    each opening their own.
+
+    Sets up:
+        - API Key authentication (for SAP API Business Hub Sandbox)
+        - OR Basic authentication (for on-premise / BTP Trial)
+        - Default headers (Accept: application/json)
+        - Automatic retry on transient failures
+        - A blocking connection pool of ``SAP_HTTP_POOL_SIZE`` keep-alive
+          connections, sized for concurrent callers
+    """
+    global _shared_session
+
+    with _shared_session_lock:
+        if _shared_session is not None:
+            return _shared_session
+
+        settings = get_settings()
+        session = requests.Session()
+
+        retry_strategy = Retry(
+            total=_MAX_RETRIES,
+            backoff_factor=_BACKOFF_FACTOR,
+            status_forcelist=_RETRY_STATUS_CODES,
+            allowed_methods=_RETRY_ALLOWED_METHODS,
+            raise_on_status=False,
+        )
+        # pool_block makes callers beyond the pool size wait for a warm
+        # connection instead of opening throwaway sockets that are closed
+        # (and lose their TLS session) as soon as they are returned
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=settings.sap_http_pool_size,
+            pool_maxsize=settings.sap_http_pool_size,
+            pool_block=True,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        # Authentication strategy
+        if settings.sap_api_key:
+            # SAP API Business Hub Sandbox — API Key auth
+            logger.info("SAPERPAdapter: using API Key authentication (Sandbox)")
+            session.headers.update({
+                "APIKey": settings.sap_api_key,
+            })
+        elif settings.sap_username and settings.sap_password:
+            # On-premise / BTP Trial — Basic Auth
+            logger.info("SAPERPAdapter: using Basic authentication")
+            session.auth = (
+                settings.sap_username,
+                settings.sap_password,
+            )
+        else:
+            logger.warning(
+                "SAPERPAdapter: no credentials configured — "
+                "set SAP_API_KEY or SAP_USERNAME+SAP_PASSWORD"
+            )
+
+        # Default headers
+        session.headers.update({
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+        })
+
+        _shared_session = session
+        return session
 
 
 class SAPERPAdapter(ERPAdapter):
@@ -109,22 +326,28 @@ class SAPERPAdapter(ERPAdapter):
         self._settings = get_settings()
         self._session: Optional[requests.Session] = None
         self._csrf_token: Optional[str] = None
+        self._csrf_fetched_at: float = 0.0  # time.monotonic() of last fetch
+        # Headers for write requests, rebuilt only when the token changes
+        self._write_headers: dict[str, str] = {}
         self._connected: bool = False
 
+        # Endpoint URLs depend only on settings — build them once
+        self._entity_url = self._build_url(_ENTITY_SET)
+        self._release_url = self._build_url("PurchaseRequisitionRelease")
+        self._service_root_url = self._build_url("")
+        self._metadata_url = self._build_url("$metadata")
+        self._pending_first_page_url = (
+            f"{self._entity_url}?{_DEFAULT_FIRST_PAGE_QS}"
+        )
+
     # ------------------------------------------------------------------
     # Lifecycle
     # ------------------------------------------------------------------
 
     def connect(self) -> None:
         """
-        Create an authenticated HTTP session to SAP with retry strategy.
-
-        Sets up:
-            - API Key authentication (for SAP API Business Hub Sandbox)
-            - OR Basic authentication (for on-premise / BTP Trial)
-            - Default headers (Accept: application/json)
-            - Automatic retry on transient failures
-            - SSL verification enabled
+        Attach to the shared, authenticated HTTP session to SAP
+        (see ``_get_shared_session``).
 
         Validates connectivity by fetching a CSRF token from SAP.
         """
@@ -138,45 +361,8 @@ class SAPERPAdapter(ERPAdapter):
             self._settings.sap_username or "(API key)",
         )
 
-        # Build session with retry strategy
-        self._session = requests.Session()
-
-        retry_strategy = Retry(
-            total=_MAX_RETRIES,
-            backoff_factor=_BACKOFF_FACTOR,
-            status_forcelist=list(_RETRY_STATUS_CODES),
-            allowed_methods=["GET", "POST", "PATCH"],
-            raise_on_status=False,
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self._session.mount("https://", adapter)
-        self._session.mount("http://", adapter)
-
-        # Authentication strategy
-        if self._settings.sap_api_key:
-            # SAP API Business Hub Sandbox — API Key auth
-            logger.info("SAPERPAdapter: using API Key authentication (Sandbox)")
-            self._session.headers.update({
-                "APIKey": self._settings.sap_api_key,
-            })
-        elif self._settings.sap_username and self._settings.sap_password:
-            # On-premise / BTP Trial — Basic Auth
-            logger.info("SAPERPAdapter: using Basic authentication")
-            self._session.auth = (
-                self._settings.sap_username,
-                self._settings.sap_password,
-            )
-        else:
-            logger.warning(
-                "SAPERPAdapter: no credentials configured — "
-                "set SAP_API_KEY or SAP_USERNAME+SAP_PASSWORD"
-            )
-
-        # Default headers
-        self._session.headers.update({
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-        })
+        # Process-wide pooled session (built on first use)
+        self._session = _get_shared_session()
 
         # Validate connection + fetch initial CSRF token
         self._fetch_csrf_token()
@@ -185,12 +371,15 @@ class SAPERPAdapter(ERPAdapter):
         logger.info("SAPERPAdapter: connection established successfully")
 
     def disconnect(self) -> None:
-        """Close HTTP session and release resources."""
-        if self._session:
-            self._session.close()
-            self._session = None
+        """
+        Release this adapter's handle on the HTTP session.
 
-        self._csrf_token = None
+        The pooled session itself is shared process-wide and stays open so
+        a reconnect or adapter switch reuses its keep-alive connections.
+        """
+        self._session = None
+
+        self._set_csrf_token(None)
         self._connected = False
         logger.info("SAPERPAdapter: disconnected")
 
@@ -219,41 +408,106 @@ class SAPERPAdapter(ERPAdapter):
         """
         self._ensure_connected()
 
-        url = self._build_url(_ENTITY_SET)
+        url = self._entity_url
+
+        # An explicit ``top`` is a hard cap (e.g. the Hybrid dashboard's 10);
+        # otherwise page through the whole backlog
+        paginate = "top" not in filters
 
         # OData query parameters
-        params: dict[str, str] = {
-            "$format": "json",
-            "$top": filters.get("top", "100"),
-            "$select": ",".join(_ODATA_FIELD_MAP.keys()),
-        }
+        if filters:
+            params: dict[str, str] = {
+                "$format": "json",
+                "$top": str(filters.get("top", _PAGE_SIZE)),
+                "$select": _SELECT_FIELDS,
+            }
+            if paginate:
+                params["$orderby"] = _DEFAULT_PENDING_PARAMS["$orderby"]
 
-        # Optional OData filter (sandbox has no reliable release-code filter)
-        odata_filter = filters.get("filter")
-        if odata_filter:
-            params["$filter"] = odata_filter
+            # Optional OData filter (sandbox has no reliable release-code filter)
+            odata_filter = filters.get("filter")
+            if odata_filter:
+                params["$filter"] = odata_filter
+        else:
+            params = _DEFAULT_PENDING_PARAMS
 
         logger.info(
             "SAPERPAdapter: fetching requisitions from %s", url,
         )
-        logger.debug("SAPERPAdapter: OData params = %s", params)
-
-        response = self._execute_request("GET", url, params=params)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("SAPERPAdapter: OData params = %s", params)
 
-        # Parse OData response envelope
-        odata_results = self._extract_odata_results(response)
+        if not filters:
+            # Pre-encoded query string — no per-poll params encoding
+            response = self._execute_request("GET", self._pending_first_page_url)
+        else:
+            first_params = (
+                {**params, "$inlinecount": "allpages"} if paginate else params
+            )
+            response = self._execute_request("GET", url, params=first_params)
+        total = self._extract_odata_count(response) if paginate else None
 
-        # Convert to DTOs
+        # Convert each page to DTOs as soon as it is parsed (one fetched_at
+        # for the whole batch) so at most a few raw OData pages are alive
+        # at once, rather than every page's dict tree plus the DTO list
+        now = datetime.now(_UTC)
         dtos = [
-            self._map_odata_to_dto(item)
-            for item in odata_results
+            self._map_odata_to_dto(item, now)
+            for item in self._extract_odata_results(response)
         ]
+        del response
+
+        if total is not None and total > len(dtos):
+            dtos.extend(self._fetch_remaining_pages(
+                url, params, first_page_len=len(dtos), total=total, fetched_at=now,
+            ))
 
         logger.info(
             "SAPERPAdapter: fetched %d pending requisitions", len(dtos),
         )
         return dtos
 
+    def _fetch_remaining_pages(
+        self,
+        url: str,
+        params: dict[str, str],
+        first_page_len: int,
+        total: int,
+        fetched_at: datetime,
+    ) -> list[RequisitionDTO]:
+        """
+        Fetch the pages after the first one concurrently via ``$skip``.
+
+        Pages are requested in parallel (bounded by ``_PAGE_WORKERS``),
+        mapped to DTOs inside the worker that parsed them, and
+        concatenated in ``$skip`` order.  Any page failure propagates.
+        """
+        page_size = first_page_len or _PAGE_SIZE
+        skips = range(first_page_len, total, page_size)
+
+        logger.info(
+            "SAPERPAdapter: %d requisitions available — fetching %d more page(s)",
+            total,
+            len(skips),
+        )
+
+        def fetch_page(skip: int) -> list[RequisitionDTO]:
+            response = self._execute_request(
+                "GET", url, params={**params, "$skip": str(skip)},
+            )
+            return [
+                self._map_odata_to_dto(item, fetched_at)
+                for item in self._extract_odata_results(response)
+            ]
+
+        with ThreadPoolExecutor(
+            max_workers=min(_PAGE_WORKERS, len(skips)),
+            thread_name_prefix="sap-page",
+        ) as pool:
+            pages = list(pool.map(fetch_page, skips))
+
+        return [dto for page in pages for dto in page]
+
     def get_requisition_details(
         self, requisition_id: str,
     ) -> RequisitionDTO:
@@ -272,12 +526,11 @@ class SAPERPAdapter(ERPAdapter):
         """
         self._ensure_connected()
 
-        url = self._build_url(_ENTITY_SET)
+        url = self._entity_url
 
         params: dict[str, str] = {
-            "$format": "json",
-            "$filter": f"PurchaseRequisition eq '{requisition_id}'",
-            "$top": "1",
+            **_BASE_DETAIL_PARAMS,
+            "$filter": f"PurchaseRequisition eq {_odata_quote(requisition_id)}",
         }
 
         logger.info(
@@ -292,13 +545,9 @@ class SAPERPAdapter(ERPAdapter):
                 "SAPERPAdapter: requisition %s not found in SAP",
                 requisition_id,
             )
-            return RequisitionDTO(
-                erp_requisition_id=requisition_id,
-                description=f"[SAP] Not found: {requisition_id}",
-                fetched_at=datetime.utcnow(),
-            )
+            return self._not_found_dto(requisition_id)
 
-        return self._map_odata_to_dto(results[0])
+        return self._map_odata_to_dto(results[0], datetime.now(_UTC))
 
     # ------------------------------------------------------------------
     # Approval Operations
@@ -343,10 +592,15 @@ class SAPERPAdapter(ERPAdapter):
         if comment:
             payload["Note"] = comment[:256]  # SAP field length limit
 
-        # Ensure fresh CSRF token for write operation
-        self._fetch_csrf_token()
+        # Reuse the session's CSRF token; _execute_request refreshes it on a
+        # 403, so only pre-fetch when it is missing or past its refresh age
+        if (
+            self._csrf_token is None
+            or time.monotonic() - self._csrf_fetched_at > _CSRF_MAX_AGE_SECONDS
+        ):
+            self._fetch_csrf_token()
 
-        url = self._build_url("PurchaseRequisitionRelease")
+        url = self._release_url
 
         logger.info(
             "SAPERPAdapter: submitting %s for %s (action_code=%s)",
@@ -401,8 +655,7 @@ class SAPERPAdapter(ERPAdapter):
             Health status dict with adapter info and response code.
         """
         try:
-            prefix = self._settings.sap_service_prefix
-            url = f"{self._settings.sap_base_url}{prefix}{_SERVICE_PATH}/$metadata"
+            url = self._metadata_url
 
             resp = None
             if self._session:
@@ -471,14 +724,14 @@ class SAPERPAdapter(ERPAdapter):
                 "SAPERPAdapter: not connected — call connect() first"
             )
 
-        headers: dict[str, str] = {}
+        # Normalise once; every later use (session, logs) shares it
+        method = method.upper()
 
-        # Inject CSRF token for write operations
-        if method.upper() in ("POST", "PATCH", "PUT", "DELETE"):
-            if self._csrf_token:
-                headers["X-CSRF-Token"] = self._csrf_token
+        # Inject CSRF token for write operations (prebuilt per token)
+        is_write = method in _WRITE_METHODS
+        headers = self._write_headers if is_write else None
 
-        start_time = time.monotonic()
+        start_time = time.perf_counter()
 
         try:
             response = self._session.request(
@@ -490,24 +743,22 @@ class SAPERPAdapter(ERPAdapter):
                 timeout=self._settings.sap_timeout,
             )
 
-            elapsed_ms = (time.monotonic() - start_time) * 1000
-
-            logger.debug(
-                "SAPERPAdapter: %s %s → %d (%.0fms)",
-                method,
-                url,
-                response.status_code,
-                elapsed_ms,
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "SAPERPAdapter: %s %s → %d (%.0fms)",
+                    method,
+                    url,
+                    response.status_code,
+                    (time.perf_counter() - start_time) * 1000,
+                )
 
             # Handle CSRF token expiry (SAP returns 403)
-            if response.status_code == 403 and method.upper() != "GET":
+            if response.status_code == 403 and is_write:
                 logger.warning(
                     "SAPERPAdapter: CSRF token expired — refreshing and retrying",
                 )
                 self._fetch_csrf_token()
-                if self._csrf_token:
-                    headers["X-CSRF-Token"] = self._csrf_token
+                headers = self._write_headers
 
                 response = self._session.request(
                     method=method,
@@ -526,13 +777,17 @@ class SAPERPAdapter(ERPAdapter):
                     f"{error_detail}"
                 )
 
-            # Parse response
+            # Parse response (orjson straight from bytes — skips requests'
+            # charset detection and the stdlib decoder)
             if response.content:
-                return response.json()
+                try:
+                    return orjson.loads(response.content)
+                except orjson.JSONDecodeError as exc:
+                    raise RuntimeError(f"SAP returned invalid JSON: {exc}")
             return {"status": "ok", "http_status": response.status_code}
 
         except requests.exceptions.Timeout:
-            elapsed_ms = (time.monotonic() - start_time) * 1000
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
             logger.error(
                 "SAPERPAdapter: request timed out after %.0fms — %s %s",
                 elapsed_ms,
@@ -579,17 +834,15 @@ class SAPERPAdapter(ERPAdapter):
                 "SAPERPAdapter: session not initialized — cannot fetch CSRF token"
             )
 
-        prefix = self._settings.sap_service_prefix
-        url = f"{self._settings.sap_base_url}{prefix}{_SERVICE_PATH}/"
-
         try:
             response = self._session.get(
-                url,
-                headers={"X-CSRF-Token": "Fetch"},
+                self._service_root_url,
+                headers=_CSRF_FETCH_HEADERS,
                 timeout=self._settings.sap_timeout,
             )
 
-            self._csrf_token = response.headers.get("X-CSRF-Token")
+            self._set_csrf_token(response.headers.get("X-CSRF-Token"))
+            self._csrf_fetched_at = time.monotonic()
 
             if self._csrf_token:
                 logger.debug("SAPERPAdapter: CSRF token acquired")
@@ -604,7 +857,12 @@ class SAPERPAdapter(ERPAdapter):
             logger.error(
                 "SAPERPAdapter: failed to fetch CSRF token — %s", exc,
             )
-            self._csrf_token = None
+            self._set_csrf_token(None)
+
+    def _set_csrf_token(self, token: Optional[str]) -> None:
+        """Store the CSRF token and rebuild the cached write headers."""
+        self._csrf_token = token
+        self._write_headers = {"X-CSRF-Token": token} if token else {}
 
     # ------------------------------------------------------------------
     # Private: URL Building
@@ -669,128 +927,70 @@ class SAPERPAdapter(ERPAdapter):
 
         return []
 
+    @staticmethod
+    def _extract_odata_count(response_data: dict[str, Any]) -> int | None:
+        """
+        Read the total row count requested via ``$inlinecount=allpages``.
+
+        Handles OData v2 (``d.__count``, a string) and v4
+        (``@odata.count``).  Returns None when the server omitted it.
+        """
+        d = response_data.get("d")
+        raw = d.get("__count") if isinstance(d, dict) else None
+        if raw is None:
+            raw = response_data.get("@odata.count")
+        try:
+            return int(raw) if raw is not None else None
+        except (TypeError, ValueError):
+            return None
+
     @staticmethod
     def _map_odata_to_dto(
         odata_item: dict[str, Any],
+        fetched_at: datetime,
     ) -> RequisitionDTO:
         """
         Convert raw SAP OData response item to RequisitionDTO.
 
-        Maps SAP field names to normalized DTO fields using the
-        _ODATA_FIELD_MAP constant. Handles type conversions for
-        numeric fields (quantity, price).
+        Walks the precomputed ``_FIELD_SPECS`` table once, so every row
+        goes through the same (OData key, DTO field, converter) steps;
+        only the two cross-field fallbacks are handled separately.
 
         Args:
             odata_item: Single item from OData results array.
+            fetched_at: Fetch timestamp, captured once per batch by the
+                        caller rather than once per row.
 
         Returns:
             Normalized RequisitionDTO instance.
         """
-        # Parse numeric fields safely
-        quantity_raw = odata_item.get("RequestedQuantity")
-        price_raw = odata_item.get("PurchaseRequisitionPrice")
-        net_amount_raw = odata_item.get("ItemNetAmount")
-
-        quantity = None
-        if quantity_raw is not None:
-            try:
-                quantity = float(quantity_raw)
-            except (ValueError, TypeError):
-                logger.warning(
-                    "SAPERPAdapter: invalid quantity value: %s",
-                    quantity_raw,
-                )
-
-        price = None
-        if price_raw is not None:
-            try:
-                price = float(price_raw)
-            except (ValueError, TypeError):
-                logger.warning(
-                    "SAPERPAdapter: invalid price value: %s",
-                    price_raw,
-                )
+        get = odata_item.get
+        kwargs = {
+            dto_field: convert(get(odata_key))
+            for odata_key, dto_field, convert in _FIELD_SPECS
+        }
 
         # Use SAP's ItemNetAmount if available, else compute
-        total_amount = None
-        if net_amount_raw is not None:
-            try:
-                total_amount = float(net_amount_raw)
-            except (ValueError, TypeError):
-                pass
-        if total_amount is None and quantity is not None and price is not None:
-            total_amount = round(quantity * price, 2)
-
-        # Parse boolean fields (SAP returns bool or string)
-        is_deleted_raw = odata_item.get("IsDeleted")
-        if isinstance(is_deleted_raw, bool):
-            is_deleted = is_deleted_raw
-        elif isinstance(is_deleted_raw, str):
-            is_deleted = is_deleted_raw.lower() in ("true", "x", "1")
-        else:
-            is_deleted = False
+        if kwargs["total_amount"] is None:
+            quantity = kwargs["quantity"]
+            price = kwargs["price"]
+            if quantity is not None and price is not None:
+                kwargs["total_amount"] = round(quantity * price, 2)
 
-        is_closed_raw = odata_item.get("IsClosed")
-        if isinstance(is_closed_raw, bool):
-            is_closed = is_closed_raw
-        elif isinstance(is_closed_raw, str):
-            is_closed = is_closed_raw.lower() in ("true", "x", "1")
-        else:
-            is_closed = False
+        if not kwargs["supplier"]:
+            kwargs["supplier"] = get("FixedSupplier")
 
-        # Parse dates (SAP format: /Date(epoch)/ or YYYY-MM-DD)
-        creation_date = SAPERPAdapter._parse_sap_date(odata_item.get("CreationDate", ""))
-        delivery_date = SAPERPAdapter._parse_sap_date(odata_item.get("DeliveryDate", ""))
+        return RequisitionDTO(**kwargs, fetched_at=fetched_at)
 
+    @staticmethod
+    def _not_found_dto(requisition_id: str) -> RequisitionDTO:
+        """Placeholder returned for an ID SAP has no record of."""
         return RequisitionDTO(
-            erp_requisition_id=str(
-                odata_item.get("PurchaseRequisition", "")
-            ).strip(),
-            item_number=odata_item.get("PurchaseRequisitionItem"),
-            material=odata_item.get("Material"),
-            description=odata_item.get("PurchaseRequisitionItemText"),
-            quantity=quantity,
-            unit=odata_item.get("BaseUnit"),
-            price=price,
-            currency=odata_item.get("PurReqnItemCurrency"),
-            plant=odata_item.get("Plant"),
-            fetched_at=datetime.utcnow(),
-            material_group=odata_item.get("MaterialGroup"),
-            total_amount=total_amount,
-            company_code=odata_item.get("CompanyCode"),
-            purchasing_group=odata_item.get("PurchasingGroup"),
-            created_by=odata_item.get("CreatedByUser"),
-            supplier=odata_item.get("Supplier") or odata_item.get("FixedSupplier"),
-            release_status=odata_item.get("PurReqnReleaseStatus"),
-            processing_status=odata_item.get("ProcessingStatus"),
-            is_deleted=is_deleted,
-            is_closed=is_closed,
-            creation_date=str(creation_date) if creation_date else None,
-            delivery_date=str(delivery_date) if delivery_date else None,
+            erp_requisition_id=requisition_id,
+            description=f"[SAP] Not found: {requisition_id}",
+            fetched_at=datetime.now(_UTC),
         )
 
-    @staticmethod
-    def _parse_sap_date(value: Any) -> str | None:
-        """
-        Convert SAP OData date to ISO YYYY-MM-DD string.
-
-        SAP dates come as /Date(epoch_ms)/ or /Date(epoch_ms+offset)/.
-        Returns None for empty/null values.
-        """
-        if not value:
-            return None
-        s = str(value).strip()
-        if not s:
-            return None
-        # Match /Date(1471392000000)/ or /Date(1471392000000+0000)/
-        m = re.search(r"/Date\(([-]?\d+)", s)
-        if m:
-            epoch_ms = int(m.group(1))
-            dt = datetime.fromtimestamp(epoch_ms / 1000, tz=timezone.utc)
-            return dt.strftime("%Y-%m-%d")
-        # Already ISO format or other string — return as-is (truncated)
-        return s[:30]
-
     @staticmethod
     def _parse_error(response: requests.Response) -> str:
         """
@@ -808,7 +1008,7 @@ class SAPERPAdapter(ERPAdapter):
             Error message string.
         """
         try:
-            error_body = response.json()
+            error_body = orjson.loads(response.content)
             error_obj = error_body.get("error", {})
             message_obj = error_obj.get("message", {})
 
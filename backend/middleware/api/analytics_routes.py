@@ -6,13 +6,16 @@ Provides:
 """
 
 import logging
+import threading
+import time
 from datetime import datetime, timedelta
 
 from fastapi import APIRouter, Depends
 from pydantic import BaseModel
-from sqlalchemy import func, case, cast, Date
+from sqlalchemy import Date, and_, func, case
 from sqlalchemy.orm import Session
 
+from config import get_settings
 from core.auth import get_current_user
 from db.models import ApprovalDecision
 from db.session import get_db
@@ -53,6 +56,13 @@ class AnalyticsSummary(BaseModel):
 # GET /analytics/summary
 # ---------------------------------------------------------------------------
 
+# (monotonic timestamp, summary) of the last computation; the lock makes
+# concurrent dashboard refreshes share one query instead of racing
+_summary_cache: tuple[float, AnalyticsSummary] | None = None
+_summary_lock = threading.Lock()
+_SUMMARY_TTL_SECONDS = get_settings().analytics_cache_ttl_seconds
+
+
 @router.get("/summary", response_model=AnalyticsSummary)
 def analytics_summary(
     db: Session = Depends(get_db),
@@ -60,91 +70,108 @@ def analytics_summary(
 ):
     """
     Return aggregated analytics computed from the approval_decisions table.
+
+    The result is reused for ``ANALYTICS_CACHE_TTL_SECONDS`` so dashboards
+    polling every few seconds don't rescan the table on each refresh.
     """
-    logger.info("GET /analytics/summary")
-
-    # ── Decision counts ──
-    total = db.query(func.count(ApprovalDecision.id)).scalar() or 0
-
-    auto_approved = (
-        db.query(func.count(ApprovalDecision.id))
-        .filter(ApprovalDecision.decision == "auto_approve")
-        .scalar()
-    ) or 0
-
-    manual_approved = (
-        db.query(func.count(ApprovalDecision.id))
-        .filter(ApprovalDecision.decision == "manual_approve")
-        .scalar()
-    ) or 0
-
-    held = (
-        db.query(func.count(ApprovalDecision.id))
-        .filter(ApprovalDecision.decision == "hold")
-        .scalar()
-    ) or 0
-
-    rejected = (
-        db.query(func.count(ApprovalDecision.id))
-        .filter(ApprovalDecision.decision == "reject")
-        .scalar()
-    ) or 0
-
-    # ── Average risk score ──
-    avg_risk = db.query(func.avg(ApprovalDecision.risk_score)).scalar() or 0.0
+    global _summary_cache
+
+    logger.debug("GET /analytics/summary")
+
+    with _summary_lock:
+        cached = _summary_cache
+        if cached and time.monotonic() - cached[0] < _SUMMARY_TTL_SECONDS:
+            return cached[1]
+
+        summary = _compute_summary(db)
+        _summary_cache = (time.monotonic(), summary)
+        return summary
+
+
+def _compute_summary(db: Session) -> AnalyticsSummary:
+    """Run the aggregate and daily-trend queries."""
+    # ── Decision counts, average risk and risk distribution (one scan) ──
+    def count_where(condition):
+        return func.sum(case((condition, 1), else_=0))
+
+    score = ApprovalDecision.risk_score
+    (
+        total,
+        auto_approved,
+        manual_approved,
+        held,
+        rejected,
+        avg_risk,
+        low,
+        medium,
+        high,
+    ) = db.query(
+        func.count(ApprovalDecision.id),
+        count_where(ApprovalDecision.decision == "auto_approve"),
+        count_where(ApprovalDecision.decision == "manual_approve"),
+        count_where(ApprovalDecision.decision == "hold"),
+        count_where(ApprovalDecision.decision == "reject"),
+        func.avg(score),
+        count_where(score < 30),
+        count_where(and_(score >= 30, score < 70)),
+        count_where(score >= 70),
+    ).one()
+
+    # SUM/AVG over an empty table are NULL, and PostgreSQL returns SUM as
+    # NUMERIC — coerce here since the models below skip validation
+    total = int(total or 0)
+    auto_approved = int(auto_approved or 0)
+    manual_approved = int(manual_approved or 0)
+    held = int(held or 0)
+    rejected = int(rejected or 0)
+    avg_risk = float(avg_risk or 0.0)
+    low = int(low or 0)
+    medium = int(medium or 0)
+    high = int(high or 0)
 
     # ── Automation rate ──
     automation_rate = (auto_approved / total * 100) if total > 0 else 0.0
 
-    # ── Risk distribution ──
-    low = (
-        db.query(func.count(ApprovalDecision.id))
-        .filter(ApprovalDecision.risk_score < 30)
-        .scalar()
-    ) or 0
-
-    medium = (
-        db.query(func.count(ApprovalDecision.id))
-        .filter(ApprovalDecision.risk_score >= 30, ApprovalDecision.risk_score < 70)
-        .scalar()
-    ) or 0
-
-    high = (
-        db.query(func.count(ApprovalDecision.id))
-        .filter(ApprovalDecision.risk_score >= 70)
-        .scalar()
-    ) or 0
-
     # ── Daily counts (last 7 days) ──
     today = datetime.utcnow().date()
     week_ago = today - timedelta(days=6)
 
+    # Filter on the raw column so the created_at index can serve a range
+    # scan; the day expression is only used for bucketing, via its label
+    day = func.date(ApprovalDecision.created_at, type_=Date).label("day")
     daily_rows = (
-        db.query(
-            cast(ApprovalDecision.created_at, Date).label("day"),
-            func.count(ApprovalDecision.id).label("cnt"),
+        db.query(day, func.count(ApprovalDecision.id).label("cnt"))
+        .filter(
+            ApprovalDecision.created_at
+            >= datetime.combine(week_ago, datetime.min.time())
         )
-        .filter(cast(ApprovalDecision.created_at, Date) >= week_ago)
-        .group_by(cast(ApprovalDecision.created_at, Date))
-        .order_by(cast(ApprovalDecision.created_at, Date))
+        .group_by(day)
+        .order_by(day)
         .all()
     )
 
     # Build a full 7-day series (fill missing days with 0)
-    daily_map = {str(r.day): r.cnt for r in daily_rows}
-    daily_counts = []
-    for i in range(7):
-        d = week_ago + timedelta(days=i)
-        daily_counts.append(DailyCount(date=str(d), count=daily_map.get(str(d), 0)))
-
-    return AnalyticsSummary(
+    # Keyed by date object (the Date type parses SQLite's string result
+    # too), so each day's ISO string is formatted exactly once
+    daily_map = {r.day: int(r.cnt) for r in daily_rows}
+    days = [week_ago + timedelta(days=i) for i in range(7)]
+    daily_counts = [
+        DailyCount.model_construct(date=d.isoformat(), count=daily_map.get(d, 0))
+        for d in days
+    ]
+
+    # Every value is already the declared type, so build the response
+    # models without re-running pydantic validation
+    return AnalyticsSummary.model_construct(
         total_decisions=total,
         auto_approved=auto_approved,
         manual_approved=manual_approved,
         held=held,
         rejected=rejected,
-        avg_risk_score=round(float(avg_risk), 2),
+        avg_risk_score=round(avg_risk, 2),
         automation_rate=round(automation_rate, 1),
-        risk_distribution=RiskDistribution(low=low, medium=medium, high=high),
+        risk_distribution=RiskDistribution.model_construct(
+            low=low, medium=medium, high=high,
+        ),
         daily_counts=daily_counts,
     )
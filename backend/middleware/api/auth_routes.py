@@ -7,17 +7,23 @@ Mounted at /api/v1/auth in main.py.
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from pydantic import BaseModel
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from pydantic import BaseModel, Field, SecretStr
+from sqlalchemy import insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, load_only
+from starlette.concurrency import run_in_threadpool
 
 from core.auth import (
     create_access_token,
+    dummy_verify_password,
     get_current_user,
     hash_password,
-    verify_password,
+    run_password_hashing,
+    verify_and_update_password,
 )
-from db.session import get_db
+from db.session import ReadSessionLocal, get_db
 from db.user_model import User
 
 logger = logging.getLogger(__name__)
@@ -30,17 +36,26 @@ router = APIRouter(prefix="/auth", tags=["Authentication"])
 # ---------------------------------------------------------------------------
 
 
+# Length caps reject oversized input before it reaches bcrypt; SecretStr
+# keeps accepted passwords out of reprs and logs
+_MAX_PASSWORD_LENGTH = 128
+
+
 class LoginRequest(BaseModel):
-    username: str
-    password: str
+    username: str = Field(min_length=1, max_length=100)
+    password: SecretStr = Field(min_length=1, max_length=_MAX_PASSWORD_LENGTH)
 
 
 class RegisterRequest(BaseModel):
-    username: str
-    password: str
-    full_name: str = ""
+    username: str = Field(
+        min_length=1, max_length=100, pattern=r"^[A-Za-z0-9_.@-]+$",
+    )
+    password: SecretStr = Field(min_length=8, max_length=_MAX_PASSWORD_LENGTH)
+    full_name: str = Field(default="", max_length=200)
 
 
+# Responses below are built with model_construct: their values are already
+# typed (validated request bodies, DB rows, claims from our own tokens)
 class UserResponse(BaseModel):
     username: str
     full_name: str
@@ -59,103 +74,182 @@ class AuthResponse(BaseModel):
 
 
 @router.post("/login", response_model=AuthResponse)
-def login(body: LoginRequest, db: Session = Depends(get_db)):
+async def login(body: LoginRequest, db: Session = Depends(get_db)):
     """
     Authenticate user and return JWT access token.
 
+    Async so the slow bcrypt check runs on the dedicated hashing pool;
+    the (sync) database calls still go through the worker threads.
+
     Raises:
         HTTPException 401 if credentials are invalid.
     """
-    stmt = select(User).where(User.username == body.username)
-    user = db.execute(stmt).scalar_one_or_none()
+    # Only what login needs — all held in the covering username index
+    stmt = (
+        select(User)
+        .options(load_only(
+            User.username, User.hashed_password, User.full_name, User.role,
+        ))
+        .where(User.username == body.username)
+    )
+    user = await run_in_threadpool(
+        lambda: db.execute(stmt).scalar_one_or_none(),
+    )
+
+    if user:
+        valid, new_hash = await run_password_hashing(
+            verify_and_update_password,
+            body.password.get_secret_value(),
+            user.hashed_password,
+        )
+    else:
+        # Same bcrypt work as a wrong password for a real user
+        await run_password_hashing(
+            dummy_verify_password, body.password.get_secret_value(),
+        )
+        valid, new_hash = False, None
 
-    if not user or not verify_password(body.password, user.hashed_password):
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid username or password",
         )
 
-    token = create_access_token(
-        data={"sub": user.username, "role": user.role},
+    # Read before any commit expires the instance (a reload here would
+    # block the event loop)
+    profile = UserResponse.model_construct(
+        username=user.username,
+        full_name=user.full_name,
+        role=user.role,
     )
 
-    logger.info("User '%s' logged in successfully", user.username)
+    # Stored hash predates the current bcrypt cost — upgrade it now that
+    # the plain-text password is at hand
+    if new_hash:
+        user.hashed_password = new_hash
+        await run_in_threadpool(db.commit)
+        logger.info("Upgraded password hash for '%s'", profile.username)
 
-    return AuthResponse(
-        access_token=token,
-        user=UserResponse(
-            username=user.username,
-            full_name=user.full_name,
-            role=user.role,
-        ),
+    token = create_access_token(
+        data={
+            "sub": profile.username,
+            "role": profile.role,
+            "name": profile.full_name,
+        },
     )
 
+    logger.info("User '%s' logged in successfully", profile.username)
+
+    return AuthResponse.model_construct(access_token=token, user=profile)
+
 
 @router.post(
     "/register",
     response_model=AuthResponse,
     status_code=status.HTTP_201_CREATED,
 )
-def register(body: RegisterRequest, db: Session = Depends(get_db)):
+async def register(body: RegisterRequest, db: Session = Depends(get_db)):
     """
     Create a new user account and return JWT access token.
 
+    Hashing and the insert run off the event loop, as in ``login``.
+
     Raises:
         HTTPException 409 if username already exists.
     """
-    # Check for existing user
-    existing = db.execute(
-        select(User).where(User.username == body.username),
-    ).scalar_one_or_none()
+    profile = UserResponse.model_construct(
+        username=body.username,
+        full_name=body.full_name or body.username,
+        role="approver",
+    )
+
+    hashed = await run_password_hashing(
+        hash_password, body.password.get_secret_value(),
+    )
 
-    if existing:
+    # Create user — one conflict-tolerant INSERT instead of SELECT-then-
+    # INSERT, so a concurrent duplicate can't slip between the two
+    def insert_user() -> int:
+        try:
+            result = db.execute(
+                _insert_ignoring_duplicates(db),
+                {**profile.model_dump(), "hashed_password": hashed},
+            )
+            db.commit()
+        except IntegrityError:
+            # Plain INSERT on a backend without a conflict clause
+            db.rollback()
+            return 0
+        return result.rowcount
+
+    if await run_in_threadpool(insert_user) == 0:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=f"Username '{body.username}' already exists",
         )
 
-    # Create user
-    user = User(
-        username=body.username,
-        hashed_password=hash_password(body.password),
-        full_name=body.full_name or body.username,
-        role="approver",
-    )
-    db.add(user)
-    db.commit()
-    db.refresh(user)
-
     # Generate token
     token = create_access_token(
-        data={"sub": user.username, "role": user.role},
+        data={
+            "sub": profile.username,
+            "role": profile.role,
+            "name": profile.full_name,
+        },
     )
 
-    logger.info("User '%s' registered successfully", user.username)
+    logger.info("User '%s' registered successfully", profile.username)
 
-    return AuthResponse(
-        access_token=token,
-        user=UserResponse(
-            username=user.username,
-            full_name=user.full_name,
-            role=user.role,
-        ),
-    )
+    return AuthResponse.model_construct(access_token=token, user=profile)
+
+
+def _insert_ignoring_duplicates(db: Session):
+    """
+    INSERT into users that skips (rowcount 0) an existing username.
+
+    Backends without a conflict clause get a plain INSERT, which raises
+    IntegrityError on a duplicate instead.
+    """
+    table = User.__table__
+    dialect = db.get_bind().dialect.name
+
+    if dialect == "postgresql":
+        return pg_insert(table).on_conflict_do_nothing(
+            index_elements=[table.c.username],
+        )
+    if dialect == "sqlite":
+        return sqlite_insert(table).on_conflict_do_nothing(
+            index_elements=[table.c.username],
+        )
+    if dialect == "mysql":
+        return insert(table).prefix_with("IGNORE")
+    return insert(table)
 
 
 @router.get("/me", response_model=UserResponse)
-def get_profile(
-    current_user: dict = Depends(get_current_user),
-    db: Session = Depends(get_db),
-):
-    """Return current user's profile from token."""
-    user = db.execute(
-        select(User).where(User.username == current_user["username"]),
-    ).scalar_one_or_none()
+def get_profile(current_user: dict = Depends(get_current_user)):
+    """
+    Return current user's profile from token.
+
+    Tokens carry the full name as the ``name`` claim, so this needs no
+    database access; only tokens issued before that claim existed fall
+    back to a user lookup.
+    """
+    if current_user["full_name"] is not None:
+        return UserResponse.model_construct(
+            username=current_user["username"],
+            full_name=current_user["full_name"],
+            role=current_user["role"],
+        )
+
+    with ReadSessionLocal() as db:
+        user = db.execute(
+            select(User).where(User.username == current_user["username"]),
+        ).scalar_one_or_none()
 
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    return UserResponse(
+    return UserResponse.model_construct(
         username=user.username,
         full_name=user.full_name,
         role=user.role,
@@ -13,8 +13,9 @@ from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from core.auth import get_current_user
+from db.models import ApprovalDecision
 from db.session import get_db
-from services.orchestrator import ApprovalOrchestrator
+from services.orchestrator import get_orchestrator
 
 logger = logging.getLogger(__name__)
 
@@ -53,48 +54,21 @@ def batch_approve(
     _user: dict = Depends(get_current_user),
 ):
     """Approve multiple pending requisitions in one call."""
-    logger.info("POST /batch/approve — %d items", len(body.ids))
+    logger.debug("POST /batch/approve — %d items", len(body.ids))
 
     if not body.ids:
         raise HTTPException(status_code=400, detail="ids list cannot be empty")
 
-    orchestrator = ApprovalOrchestrator()
-    results: list[BatchItemResult] = []
-    failed = 0
-
-    for erp_id in body.ids:
-        try:
-            result = orchestrator.approve_decision(
-                erp_requisition_id=erp_id,
-                db=db,
-                comment=body.comment,
-            )
-            if result:
-                results.append(BatchItemResult(
-                    erp_requisition_id=erp_id,
-                    success=True,
-                    message="Approved",
-                ))
-            else:
-                failed += 1
-                results.append(BatchItemResult(
-                    erp_requisition_id=erp_id,
-                    success=False,
-                    message="No pending decision found",
-                ))
-        except Exception as exc:
-            failed += 1
-            results.append(BatchItemResult(
-                erp_requisition_id=erp_id,
-                success=False,
-                message=str(exc),
-            ))
+    try:
+        decisions = get_orchestrator().approve_decisions_bulk(
+            erp_requisition_ids=body.ids,
+            db=db,
+            comment=body.comment,
+        )
+    except Exception as exc:
+        return _failed_batch(body.ids, str(exc))
 
-    return BatchResponse(
-        processed=len(body.ids) - failed,
-        failed=failed,
-        results=results,
-    )
+    return _batch_response(body.ids, decisions, "Approved")
 
 
 # ---------------------------------------------------------------------------
@@ -108,45 +82,63 @@ def batch_reject(
     _user: dict = Depends(get_current_user),
 ):
     """Reject multiple pending requisitions in one call."""
-    logger.info("POST /batch/reject — %d items", len(body.ids))
+    logger.debug("POST /batch/reject — %d items", len(body.ids))
 
     if not body.ids:
         raise HTTPException(status_code=400, detail="ids list cannot be empty")
 
-    orchestrator = ApprovalOrchestrator()
-    results: list[BatchItemResult] = []
-    failed = 0
-
-    for erp_id in body.ids:
-        try:
-            result = orchestrator.reject_decision(
-                erp_requisition_id=erp_id,
-                db=db,
-                comment=body.comment,
-            )
-            if result:
-                results.append(BatchItemResult(
-                    erp_requisition_id=erp_id,
-                    success=True,
-                    message="Rejected",
-                ))
-            else:
-                failed += 1
-                results.append(BatchItemResult(
-                    erp_requisition_id=erp_id,
-                    success=False,
-                    message="No pending decision found",
-                ))
-        except Exception as exc:
-            failed += 1
-            results.append(BatchItemResult(
-                erp_requisition_id=erp_id,
-                success=False,
-                message=str(exc),
-            ))
+    try:
+        decisions = get_orchestrator().reject_decisions_bulk(
+            erp_requisition_ids=body.ids,
+            db=db,
+            comment=body.comment,
+        )
+    except Exception as exc:
+        return _failed_batch(body.ids, str(exc))
+
+    return _batch_response(body.ids, decisions, "Rejected")
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _batch_response(
+    ids: list[str],
+    decisions: list[ApprovalDecision | None],
+    success_message: str,
+) -> BatchResponse:
+    """Per-ID results for a batch the orchestrator committed."""
+    results = [
+        BatchItemResult(
+            erp_requisition_id=erp_id,
+            success=True,
+            message=success_message,
+        )
+        if decision is not None
+        else BatchItemResult(
+            erp_requisition_id=erp_id,
+            success=False,
+            message="No pending decision found",
+        )
+        for erp_id, decision in zip(ids, decisions)
+    ]
+    failed = sum(not r.success for r in results)
 
     return BatchResponse(
-        processed=len(body.ids) - failed,
+        processed=len(ids) - failed,
         failed=failed,
         results=results,
     )
+
+
+def _failed_batch(ids: list[str], message: str) -> BatchResponse:
+    """Every item failed — the single batch transaction was rolled back."""
+    return BatchResponse(
+        processed=0,
+        failed=len(ids),
+        results=[
+            BatchItemResult(erp_requisition_id=erp_id, success=False, message=message)
+            for erp_id in ids
+        ],
+    )
@@ -6,29 +6,39 @@ Routes are thin — they delegate to the services layer immediately.
 """
 
 import logging
+from collections.abc import Iterable, Iterator
+from itertools import chain
 from typing import Optional
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+from sqlalchemy import RowMapping, func, select
 from sqlalchemy.orm import Session
 
 from config import get_settings
 from core.auth import get_current_user
 from db.models import ApprovalDecision, NotificationLog
-from db.session import get_db
+from db.session import SessionLocal, get_db
 from models.schemas import (
     ApprovalDecisionOut,
     ApproveRejectRequest,
     ApproveRejectResponse,
     DecisionListResponse,
+    DecisionState,
     DetectResponse,
+    ERPBatchApprovalRequest,
+    ERPBatchApprovalResponse,
+    ERPMode,
     HealthResponse,
+    NotificationChannel,
     NotificationListResponse,
     NotificationLogOut,
     UndoResponse,
 )
 from scheduler.worker import get_adapter, is_scheduler_running, set_adapter
-from services.orchestrator import ApprovalOrchestrator
+from services.orchestrator import get_orchestrator
 
 logger = logging.getLogger(__name__)
 
@@ -41,9 +51,12 @@ settings = get_settings()
 # ---------------------------------------------------------------------------
 
 @router.get("/health", response_model=HealthResponse, tags=["health"])
-def health_check():
+async def health_check():
     """
     Enhanced health check endpoint.
+
+    Only reads in-process flags, so it runs directly on the event loop —
+    frequent liveness/readiness probes never wait for a worker thread.
     
     Returns:
         - status: Service health status
@@ -51,7 +64,7 @@ def health_check():
         - scheduler_running: Whether background scheduler is active
         - erp_mode: Current ERP adapter mode (mock/sap)
     """
-    return HealthResponse(
+    return HealthResponse.model_construct(
         status="ok",
         service="erp-approval-middleware",
         scheduler_running=is_scheduler_running(),
@@ -97,8 +110,8 @@ def detect_requisitions(db: Session = Depends(get_db), _user: dict = Depends(get
     except Exception as exc:
         logger.warning("Adapter connection attempt: %s", exc)
     
-    # Create orchestrator and trigger detection
-    orchestrator = ApprovalOrchestrator()
+    # Trigger detection on the shared orchestrator
+    orchestrator = get_orchestrator()
     
     try:
         staged_decisions = orchestrator.detect_and_stage_requisitions(
@@ -122,6 +135,40 @@ def detect_requisitions(db: Session = Depends(get_db), _user: dict = Depends(get
         )
 
 
+@router.get("/requisitions/pending", tags=["approvals"])
+def stream_pending_requisitions(_user: dict = Depends(get_current_user)):
+    """
+    Stream the ERP's pending requisitions as newline-delimited JSON.
+
+    Rows are encoded as the adapter yields them, so a large backlog is
+    never held in memory all at once.  The first row is pulled before
+    the response is built, so a failing ERP/database query is a 500
+    rather than a 200 with a truncated body.
+    """
+    adapter = get_adapter()
+    if not adapter:
+        raise HTTPException(
+            status_code=503,
+            detail="ERP adapter not initialized. Ensure scheduler is running.",
+        )
+
+    requisitions = adapter.iter_pending_requisitions()
+    try:
+        first = next(requisitions, None)
+    except Exception as exc:
+        logger.error("Failed to stream pending requisitions: %s", exc)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to fetch pending requisitions: {str(exc)}",
+        )
+
+    rows = (
+        orjson.dumps(requisition, option=orjson.OPT_APPEND_NEWLINE)
+        for requisition in chain(() if first is None else (first,), requisitions)
+    )
+    return StreamingResponse(rows, media_type="application/x-ndjson")
+
+
 # ---------------------------------------------------------------------------
 # Undo / Cancel
 # ---------------------------------------------------------------------------
@@ -145,7 +192,7 @@ def undo_decision(erp_requisition_id: str, db: Session = Depends(get_db), _user:
     """
     logger.info("POST /undo/%s - attempting to cancel decision", erp_requisition_id)
     
-    orchestrator = ApprovalOrchestrator()
+    orchestrator = get_orchestrator()
     
     try:
         cancelled_decision = orchestrator.undo_decision(
@@ -203,7 +250,7 @@ def approve_decision(
         HTTPException: 404 if no pending decision found
     """
     logger.info("POST /approve/%s", erp_requisition_id)
-    orchestrator = ApprovalOrchestrator()
+    orchestrator = get_orchestrator()
 
     try:
         comment = body.comment if body else None
@@ -257,7 +304,7 @@ def reject_decision(
         HTTPException: 404 if no pending decision found
     """
     logger.info("POST /reject/%s", erp_requisition_id)
-    orchestrator = ApprovalOrchestrator()
+    orchestrator = get_orchestrator()
 
     try:
         comment = body.comment if body else None
@@ -294,58 +341,74 @@ def reject_decision(
 # Decisions Query
 # ---------------------------------------------------------------------------
 
+# Columns populated by GET /decisions; the rest of ApprovalDecisionOut is
+# sent with its None defaults
+_DECISION_OUT_DEFAULTS = {
+    name: None if field.is_required() else field.default
+    for name, field in ApprovalDecisionOut.model_fields.items()
+}
+_DECISION_LIST_COLUMNS = (
+    ApprovalDecision.id,
+    ApprovalDecision.erp_requisition_id,
+    ApprovalDecision.risk_score,
+    ApprovalDecision.risk_explanation,
+    ApprovalDecision.decision,
+    ApprovalDecision.state,
+    ApprovalDecision.commit_at,
+    ApprovalDecision.committed_at,
+    ApprovalDecision.comment,
+    ApprovalDecision.created_at,
+)
+
+# Rows fetched per server-side cursor round-trip while streaming a page
+_LIST_STREAM_BATCH = 500
+
+
 @router.get("/decisions", response_model=DecisionListResponse, tags=["approvals"])
 def list_decisions(
-    state: Optional[str] = Query(None, description="Filter by state (e.g., pending_commit, committed, cancelled)"),
-    db: Session = Depends(get_db),
+    state: Optional[DecisionState] = Query(None, description="Filter by state (e.g., pending_commit, committed, cancelled)"),
+    limit: int = Query(100, ge=1, le=1000, description="Page size"),
+    offset: int = Query(0, ge=0, description="Rows to skip (newest first)"),
     _user: dict = Depends(get_current_user),
 ):
     """
-    List all approval decisions with optional state filtering.
+    List approval decisions, newest first, with optional state filtering.
     
     Query parameters:
         - state: Optional filter by decision state
           Valid states: detected, pending_commit, committed, cancelled, failed
+        - limit / offset: Page window over the filtered result
           
     Returns:
-        List of approval decisions and total count.
+        One page of approval decisions and the total matching count,
+        streamed row by row so a large page is never held in memory.
     """
-    logger.info("GET /decisions - state filter: %s", state)
+    logger.debug(
+        "GET /decisions - state filter: %s, limit=%d, offset=%d",
+        state, limit, offset,
+    )
     
     try:
-        # Build query
-        stmt = select(ApprovalDecision).order_by(ApprovalDecision.created_at.desc())
+        # Only the columns the list view returns — the enriched SAP fields
+        # stay in the database
+        stmt = (
+            select(*_DECISION_LIST_COLUMNS)
+            .order_by(ApprovalDecision.created_at.desc(), ApprovalDecision.id)
+            .limit(limit)
+            .offset(offset)
+        )
+        count_stmt = select(func.count()).select_from(ApprovalDecision)
         
         # Apply state filter if provided
         if state:
             stmt = stmt.where(ApprovalDecision.state == state)
+            count_stmt = count_stmt.where(ApprovalDecision.state == state)
             logger.debug("Filtering decisions by state: %s", state)
         
-        # Execute query
-        decisions = db.execute(stmt).scalars().all()
+        logger.debug("Streaming up to %d decisions", limit)
         
-        # Convert to response models (UUID to string)
-        decisions_out = [
-            ApprovalDecisionOut(
-                id=str(decision.id),
-                erp_requisition_id=decision.erp_requisition_id,
-                risk_score=decision.risk_score,
-                risk_explanation=decision.risk_explanation,
-                decision=decision.decision,
-                state=decision.state,
-                commit_at=decision.commit_at,
-                committed_at=decision.committed_at,
-                comment=decision.comment,
-                created_at=decision.created_at,
-            )
-            for decision in decisions
-        ]
-        
-        logger.info("Returning %d decisions", len(decisions_out))
-        
-        return DecisionListResponse(
-            decisions=decisions_out,
-            total=len(decisions_out),
+        return _stream_list_page(
+            "decisions", stmt, count_stmt, _DECISION_OUT_DEFAULTS,
         )
         
     except Exception as exc:
@@ -356,56 +419,126 @@ def list_decisions(
         )
 
 
+def _stream_list_page(
+    list_key: str,
+    stmt,
+    count_stmt,
+    defaults: dict | None = None,
+) -> StreamingResponse:
+    """
+    Run a list page's count and row query, then stream the rows as JSON.
+
+    Both queries share one session (on PostgreSQL a REPEATABLE READ
+    transaction, so ``total`` and the rows come from the same snapshot),
+    and the first batch is fetched before the response is built — a
+    database error is raised here, inside the route's try/except, rather
+    than after a 200 and a partial body have gone out.  The session
+    stays open for the rest of the cursor and is closed once the
+    response finishes.
+    """
+    db = SessionLocal()
+    try:
+        if db.get_bind().dialect.name == "postgresql":
+            db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+        total = db.scalar(count_stmt)
+        rows = db.execute(
+            stmt, execution_options={"yield_per": _LIST_STREAM_BATCH},
+        ).mappings()
+        first_batch = rows.fetchmany(_LIST_STREAM_BATCH)
+    except Exception:
+        db.close()
+        raise
+
+    return StreamingResponse(
+        _iter_list_page_json(
+            list_key, chain(first_batch, rows), total, defaults,
+        ),
+        media_type="application/json",
+        background=BackgroundTask(db.close),
+    )
+
+
+def _iter_list_page_json(
+    list_key: str,
+    rows: Iterable[RowMapping],
+    total: int,
+    defaults: dict | None = None,
+) -> Iterator[bytes]:
+    """
+    Encode a ``{list_key: [...], "total": N}`` list response incrementally.
+
+    ``yield_per`` makes SQLAlchemy use a server-side cursor (psycopg2
+    named cursor), so only one batch of rows is in memory at a time.
+    Rows come straight from typed columns, so each is encoded with orjson
+    instead of validating a model per row; ``defaults`` fills response
+    fields the query doesn't select.
+    """
+    yield b'{"%s":[' % list_key.encode()
+    for i, row in enumerate(rows):
+        item = {**defaults, **row} if defaults else dict(row)
+        yield (b"," if i else b"") + orjson.dumps(item)
+    yield b'],"total":%d}' % total
+
+
 # ---------------------------------------------------------------------------
 # Notifications Query
 # ---------------------------------------------------------------------------
 
+_NOTIFICATION_LIST_COLUMNS = tuple(
+    getattr(NotificationLog, name) for name in NotificationLogOut.model_fields
+)
+
 @router.get("/notifications", response_model=NotificationListResponse, tags=["notifications"])
 def list_notifications(
-    channel: Optional[str] = Query(None, description="Filter by channel (email, slack)"),
+    channel: Optional[NotificationChannel] = Query(None, description="Filter by channel (email, slack)"),
     erp_requisition_id: Optional[str] = Query(None, description="Filter by requisition ID"),
-    db: Session = Depends(get_db),
+    limit: int = Query(100, ge=1, le=1000, description="Page size"),
+    offset: int = Query(0, ge=0, description="Rows to skip (newest first)"),
     _user: dict = Depends(get_current_user),
 ):
     """
-    List all notification logs with optional filtering.
+    List notification logs, newest first, with optional filtering.
 
     Query parameters:
         - channel: Filter by notification channel (email | slack)
         - erp_requisition_id: Filter by ERP requisition ID
+        - limit / offset: Page window over the filtered result
 
     Returns:
-        List of notification log records and total count.
+        One page of notification log records and the total matching count.
     """
-    logger.info(
-        "GET /notifications - channel=%s, erp_requisition_id=%s",
+    logger.debug(
+        "GET /notifications - channel=%s, erp_requisition_id=%s, limit=%d, offset=%d",
         channel,
         erp_requisition_id,
+        limit,
+        offset,
     )
 
     try:
-        stmt = select(NotificationLog).order_by(NotificationLog.created_at.desc())
-
+        filters = []
         if channel:
-            stmt = stmt.where(NotificationLog.channel == channel)
+            filters.append(NotificationLog.channel == channel)
         if erp_requisition_id:
-            stmt = stmt.where(
+            filters.append(
                 NotificationLog.erp_requisition_id == erp_requisition_id
             )
 
-        notifications = db.execute(stmt).scalars().all()
-
-        notifications_out = [
-            NotificationLogOut.model_validate(n)
-            for n in notifications
-        ]
+        stmt = (
+            select(*_NOTIFICATION_LIST_COLUMNS)
+            .where(*filters)
+            .order_by(NotificationLog.created_at.desc(), NotificationLog.id.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+        count_stmt = (
+            select(func.count()).select_from(NotificationLog).where(*filters)
+        )
 
-        logger.info("Returning %d notifications", len(notifications_out))
+        logger.debug("Streaming up to %d notifications", limit)
 
-        return NotificationListResponse(
-            notifications=notifications_out,
-            total=len(notifications_out),
-        )
+        # Selected columns are exactly NotificationLogOut's fields
+        return _stream_list_page("notifications", stmt, count_stmt)
 
     except Exception as exc:
         logger.error("Failed to query notifications: %s", exc)
@@ -419,8 +552,47 @@ def list_notifications(
 # Adapter Management
 # ---------------------------------------------------------------------------
 
+@router.post("/approvals:batch", response_model=ERPBatchApprovalResponse, tags=["admin"])
+def submit_approvals_batch(
+    body: ERPBatchApprovalRequest,
+    db: Session = Depends(get_db),
+    _user: dict = Depends(get_current_user),
+):
+    """
+    Push several decisions straight to the active ERP adapter in one call.
+
+    Bypasses the grace period — intended for operators replaying or
+    back-filling decisions.  Pending decisions for the same requisitions
+    are settled as committed so the commit worker doesn't submit them
+    again.  Items the ERP fails on come back with ``status: "error"``.
+    """
+    logger.info("POST /approvals:batch — %d items", len(body.items))
+
+    adapter = get_adapter()
+    if adapter is None:
+        raise HTTPException(status_code=503, detail="ERP adapter not initialized")
+
+    try:
+        results = get_orchestrator().submit_directly(
+            adapter,
+            [
+                (item.requisition_id, item.decision, item.comment)
+                for item in body.items
+            ],
+            db,
+        )
+    except Exception as exc:
+        logger.error("Batch ERP submission failed: %s", exc)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Batch ERP submission failed: {str(exc)}",
+        )
+
+    return ERPBatchApprovalResponse(results=results, total=len(results))
+
+
 @router.post("/switch-adapter", tags=["admin"])
-def switch_adapter(mode: str = Query(..., regex="^(mock|sap|hybrid)$"), _user: dict = Depends(get_current_user)):
+def switch_adapter(mode: ERPMode = Query(...), _user: dict = Depends(get_current_user)):
     """
     Switch the ERP adapter at runtime between mock and SAP.
 
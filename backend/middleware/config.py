@@ -3,7 +3,7 @@ Configuration module for ERP Approval Middleware.
 Loads settings from environment variables / .env file using pydantic-settings.
 """
 
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -17,6 +17,7 @@ class Settings(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=False,
+        frozen=True,  # one immutable instance, shared via get_settings()
     )
 
     # --- Application ---
@@ -31,6 +32,11 @@ class Settings(BaseSettings):
     db_user: str = "postgres"
     db_password: str = "changeme"
     db_name: str = "erp_middleware"
+    db_pool_size: int = 20          # Persistent connections kept in the pool
+    db_max_overflow: int = 20       # Extra connections allowed under burst load
+    db_pool_timeout: int = 30       # Seconds to wait for a free connection
+    db_pool_recycle: int = 1800     # Reconnect connections older than this (seconds)
+    db_pool_pre_ping: bool = True   # Verify connections before handing them out
 
     # --- SAP Connection ---
     sap_base_url: str = "https://sandbox.api.sap.com"
@@ -39,6 +45,7 @@ class Settings(BaseSettings):
     sap_api_key: str = ""  # SAP API Business Hub sandbox key
     sap_timeout: int = 30
     sap_service_prefix: str = "/s4hanacloud"  # "/s4hanacloud" for API Hub Sandbox, "" for on-premise/BTP
+    sap_http_pool_size: int = 32  # Keep-alive connections shared by all SAP adapter calls
 
     # --- ERP Adapter Mode ---
     erp_mode: str = "mock"  # mock | sap | hybrid
@@ -55,14 +62,19 @@ class Settings(BaseSettings):
     # --- Auto-Commit ---
     auto_commit_enabled: bool = True  # Set False to disable automatic ERP commit
 
+    # --- Analytics ---
+    analytics_cache_ttl_seconds: float = 15.0  # /analytics/summary reuse window (0 disables)
+
     # --- API ---
     api_host: str = "0.0.0.0"
     api_port: int = 8000
+    api_threadpool_size: int = 64  # Worker threads for sync route handlers (AnyIO default: 40)
 
     # --- JWT Authentication ---
     jwt_secret_key: str = "asap-super-secret-key-change-in-production"
     jwt_algorithm: str = "HS256"
     jwt_expiry_minutes: int = 480  # 8 hours
+    password_bcrypt_rounds: int = 12  # bcrypt cost; weaker stored hashes are upgraded on login
 
     def get_database_url(self) -> str:
         """
@@ -70,6 +82,11 @@ class Settings(BaseSettings):
         Uses DATABASE_URL env var if set (for Render/production),
         otherwise builds from individual DB_* components (for local dev).
         """
+        return self.sqlalchemy_database_url
+
+    @cached_property
+    def sqlalchemy_database_url(self) -> str:
+        """The resolved URL, computed once — settings are immutable."""
         if self.database_url:
             # Render provides postgres://, but SQLAlchemy needs postgresql://
             url = self.database_url
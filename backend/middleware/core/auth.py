@@ -6,24 +6,46 @@ Pure utility module:
     - Stateless functions
 """
 
+import asyncio
 import logging
-from datetime import datetime, timedelta
-from typing import Any
-
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+import jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import JWTError, jwt
 from passlib.context import CryptContext
 
 from config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Settings are frozen and cached for the process, so bind what the hot
+# paths read once instead of looking it up per token
+_settings = get_settings()
+_JWT_SECRET = _settings.jwt_secret_key
+_JWT_ALGORITHM = _settings.jwt_algorithm
+_JWT_EXPIRY_MINUTES = _settings.jwt_expiry_minutes
+
 # ---------------------------------------------------------------------------
 # Password hashing
 # ---------------------------------------------------------------------------
 
-_pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# The configured cost is both the default for new hashes and the minimum
+# accepted without an upgrade, so retuning it migrates users as they log in
+_bcrypt_rounds = _settings.password_bcrypt_rounds
+_pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=_bcrypt_rounds,
+    bcrypt__min_rounds=_bcrypt_rounds,
+)
 
 
 def hash_password(plain: str) -> str:
@@ -36,6 +58,71 @@ def verify_password(plain: str, hashed: str) -> bool:
     return _pwd_context.verify(plain, hashed)
 
 
+def verify_and_update_password(plain: str, hashed: str) -> tuple[bool, str | None]:
+    """
+    Verify a password and report whether its stored hash needs upgrading.
+
+    Returns:
+        ``(valid, new_hash)`` — ``new_hash`` is a replacement hash at the
+        current cost when the password is valid but the stored hash is
+        weaker than configured, otherwise ``None``.
+    """
+    return _pwd_context.verify_and_update(plain, hashed)
+
+
+# Built at import so even the first unknown-user login pays the full cost
+_DUMMY_HASH = _pwd_context.hash("dummy-password-for-timing")
+
+
+def dummy_verify_password(plain: str) -> None:
+    """
+    Spend the time of a real verification without checking anything.
+
+    Call when the username does not exist so failed logins take the same
+    time either way and response latency can't be used to enumerate users.
+    """
+    _pwd_context.verify(plain, _DUMMY_HASH)
+
+
+_T = TypeVar("_T")
+
+# bcrypt releases the GIL, so one thread per core hashes in parallel; a
+# login storm queues here instead of occupying the worker threads that
+# every other (sync) route runs on
+_HASH_WORKERS = os.cpu_count() or 1
+_hash_executor = ThreadPoolExecutor(
+    max_workers=_HASH_WORKERS,
+    thread_name_prefix="pwhash",
+)
+
+# Hashes running or queued on the pool.  Past this a caller would wait
+# several bcrypt rounds just to reach a thread, so it gets a 503 right
+# away instead of piling onto an unbounded backlog.
+_HASH_MAX_PENDING = _HASH_WORKERS * 4
+_hash_slots = threading.BoundedSemaphore(_HASH_MAX_PENDING)
+
+
+async def run_password_hashing(func: Callable[..., _T], *args: Any) -> _T:
+    """
+    Await a blocking hash/verify helper run on the hashing pool.
+
+    Raises:
+        HTTPException 503 if the pool's backlog is already full.
+    """
+    if not _hash_slots.acquire(blocking=False):
+        logger.warning("Password hashing backlog full — shedding request")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many concurrent authentication requests",
+            headers={"Retry-After": "1"},
+        )
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_hash_executor, func, *args)
+    finally:
+        _hash_slots.release()
+
+
 # ---------------------------------------------------------------------------
 # JWT token creation / decoding
 # ---------------------------------------------------------------------------
@@ -57,22 +144,47 @@ def create_access_token(
     Returns:
         Encoded JWT string.
     """
-    settings = get_settings()
     to_encode = data.copy()
 
-    expire = datetime.utcnow() + timedelta(
-        minutes=expires_minutes or settings.jwt_expiry_minutes,
+    # ``exp`` is epoch seconds on the wire, so compute it that way directly
+    to_encode["exp"] = int(time.time()) + 60 * (
+        expires_minutes or _JWT_EXPIRY_MINUTES
     )
-    to_encode.update({"exp": expire})
 
-    token = jwt.encode(
-        to_encode,
-        settings.jwt_secret_key,
-        algorithm=settings.jwt_algorithm,
-    )
+    token = jwt.encode(to_encode, _JWT_SECRET, algorithm=_JWT_ALGORITHM)
     return token
 
 
+# Decoded claims per raw token: token → (exp as epoch seconds, claims).
+# A client sends the same bearer token on every request, so repeat calls
+# skip the HMAC and base64/JSON work.  Entries die with their token's
+# ``exp`` (re-decoding then fails with the usual expiry error).  Hits are
+# lock-free single dict operations; only inserts take the lock, evicting
+# the earliest-cached token — usually the nearest to expiry anyway —
+# beyond _JWT_CACHE_MAX.
+_JWT_CACHE_MAX = 10_000
+_jwt_cache: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+_jwt_cache_lock = threading.Lock()
+
+
+def _decode_cached(token: str) -> dict[str, Any]:
+    """Signature-check and decode a token, memoized until it expires."""
+    hit = _jwt_cache.get(token)
+    if hit is not None:
+        if hit[0] > time.time():
+            return hit[1]
+        _jwt_cache.pop(token, None)
+
+    # Invalid or expired tokens raise here and are never cached
+    claims = jwt.decode(token, _JWT_SECRET, algorithms=[_JWT_ALGORITHM])
+
+    with _jwt_cache_lock:
+        _jwt_cache[token] = (claims.get("exp", math.inf), claims)
+        if len(_jwt_cache) > _JWT_CACHE_MAX:
+            _jwt_cache.popitem(last=False)
+    return claims
+
+
 def decode_access_token(token: str) -> dict[str, Any]:
     """
     Decode and validate a JWT token.
@@ -83,21 +195,17 @@ def decode_access_token(token: str) -> dict[str, Any]:
     Raises:
         HTTPException 401 if token is invalid or expired.
     """
-    settings = get_settings()
     try:
-        payload = jwt.decode(
-            token,
-            settings.jwt_secret_key,
-            algorithms=[settings.jwt_algorithm],
-        )
-        return payload
-    except JWTError as exc:
+        payload = _decode_cached(token)
+    except jwt.InvalidTokenError as exc:
         logger.warning("JWT decode failed: %s", exc)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired token",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    # Callers get their own copy; the cached claims stay untouched
+    return dict(payload)
 
 
 # ---------------------------------------------------------------------------
@@ -110,7 +218,8 @@ def get_current_user(
 ) -> dict[str, Any]:
     """
     FastAPI dependency that validates the Bearer token and returns
-    the decoded user claims (sub, role, exp).
+    the decoded user claims as ``username``, ``role`` and ``full_name``
+    (``None`` for tokens issued without the ``name`` claim).
 
     Usage::
         @router.get("/protected")
@@ -129,4 +238,5 @@ def get_current_user(
     return {
         "username": username,
         "role": payload.get("role", "approver"),
+        "full_name": payload.get("name"),
     }
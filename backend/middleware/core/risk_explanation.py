@@ -13,39 +13,41 @@ natural-language explanation when triggered.
 """
 
 import logging
-from typing import Optional
 
+from core.risk_scoring import _evaluate_rules
 from models.domain import RequisitionDTO
 
 logger = logging.getLogger(__name__)
 
 
-# ---------------------------------------------------------------------------
-# Configuration constants — thresholds and categories
-# ---------------------------------------------------------------------------
+# The rules, their thresholds and their reasons are defined once, in
+# core.risk_scoring; this module turns the reasons into explanations.
+_ALL_CLEAR = "All parameters within normal operational thresholds"
 
-# Value thresholds (must stay in sync with RiskScoringEngine constants)
-# Calibrated for SAP Sandbox API data (typical: price 10–25, qty 1–10, totals 30–200)
-HIGH_VALUE_THRESHOLD: float = 150.0         # Total > 150 → high risk
-ELEVATED_VALUE_THRESHOLD: float = 75.0      # Total > 75  → elevated risk
-MODERATE_VALUE_THRESHOLD: float = 30.0      # Total > 30  → moderate risk
 
-# Unit-price threshold
-UNIT_PRICE_THRESHOLD: float = 15.0          # Unit price > 15 → anomalous
+def score_and_explain(requisition: RequisitionDTO) -> tuple[float, str]:
+    """
+    Compute a requisition's risk score and explanation in one pass.
 
-# Quantity threshold
-QUANTITY_THRESHOLD: float = 5.0             # Qty > 5 → bulk order flag
+    Equivalent to ``RiskScoringEngine().score(req)`` followed by
+    ``RiskExplanationEngine().explain(req, score)`` — each rule is
+    evaluated once, adding its points and its reason together.
 
-# High-risk material keywords (case-insensitive match)
-HIGH_RISK_MATERIALS: set[str] = {
-    "HAZMAT", "CHEM", "CHEMICAL", "EXPLOSIVE",
-    "RADIOACTIVE", "BIOHAZARD", "TOXIC",
-}
+    Args:
+        requisition: Normalised requisition DTO.
 
-# Restricted / sensitive plant codes
-RESTRICTED_PLANTS: set[str] = {
-    "NUCLEAR", "DEFENSE", "WEAPONS", "CLASSIFIED",
-}
+    Returns:
+        ``(risk_score, explanation)`` with the score capped at 100.0.
+    """
+    reasons: list[str] = []
+    score = _evaluate_rules(
+        requisition.price,
+        requisition.quantity,
+        requisition.material,
+        requisition.plant,
+        reasons,
+    )
+    return score, "; ".join(reasons) if reasons else _ALL_CLEAR
 
 
 class RiskExplanationEngine:
@@ -53,36 +55,40 @@ class RiskExplanationEngine:
     Generates human-readable, rule-based risk explanations for procurement
     requisitions.
 
-    Each public method evaluates one risk dimension and returns an optional
-    explanation string.  The top-level ``explain()`` method aggregates all
-    triggered rules into a single multi-line explanation.
+    ``explain()`` runs the shared rule set from ``core.risk_scoring`` and
+    joins the reasons of every rule that fires into one explanation.
 
     Design principles:
         - Pure function-style: no side-effects, no I/O
-        - Each rule is independently testable
-        - New rules are added by writing a ``_check_*`` method and
-          registering it in ``_all_checks``
+        - New rules are added to ``_build_rule_evaluator`` in
+          ``core.risk_scoring``, which scores and explains them together
 
     Usage:
-        engine = RiskExplanationEngine()
-        explanation = engine.explain(requisition, risk_score)
+        explanation = RiskExplanationEngine.explain(requisition, risk_score)
+        # or: from core.risk_explanation import explain
     """
 
+    # Stateless — explain() is a classmethod, also exported as the
+    # module-level ``explain``, so no instance is needed at all
+    __slots__ = ()
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
+    @classmethod
     def explain(
-        self,
+        cls,
         requisition: RequisitionDTO,
         risk_score: float,
     ) -> str:
         """
         Produce a consolidated, human-readable risk explanation.
 
-        Runs every registered check against the requisition and collects
-        the triggered explanations.  If no rules fire, a default "all
-        clear" message is returned.
+        Runs every rule against the requisition and collects the
+        triggered explanations.  If no rules fire, a default "all
+        clear" message is returned.  Every rule that fires also adds to
+        the risk score, so a zero score returns that message directly.
 
         Args:
             requisition: Normalised requisition DTO.
@@ -92,17 +98,20 @@ class RiskExplanationEngine:
             Multi-line explanation string (individual reasons separated
             by ``"; "``).
         """
-        explanations: list[str] = []
+        if risk_score <= 0.0:
+            return _ALL_CLEAR
 
-        for check in self._all_checks():
-            result = check(requisition, risk_score)
-            if result:
-                explanations.append(result)
+        explanations: list[str] = []
+        _evaluate_rules(
+            requisition.price,
+            requisition.quantity,
+            requisition.material,
+            requisition.plant,
+            explanations,
+        )
 
         if not explanations:
-            explanations.append(
-                "All parameters within normal operational thresholds"
-            )
+            explanations.append(_ALL_CLEAR)
 
         explanation_text = "; ".join(explanations)
 
@@ -114,122 +123,6 @@ class RiskExplanationEngine:
 
         return explanation_text
 
-    # ------------------------------------------------------------------
-    # Rule registry
-    # ------------------------------------------------------------------
-
-    def _all_checks(self):
-        """Return an ordered list of all rule-check callables."""
-        return [
-            self._check_high_total_value,
-            self._check_elevated_total_value,
-            self._check_high_unit_price,
-            self._check_high_quantity,
-            self._check_high_risk_material,
-            self._check_restricted_plant,
-            self._check_missing_price,
-            self._check_missing_quantity,
-        ]
-
-    # ------------------------------------------------------------------
-    # Individual rule checks
-    # ------------------------------------------------------------------
 
-    @staticmethod
-    def _check_high_total_value(
-        req: RequisitionDTO, _score: float,
-    ) -> Optional[str]:
-        """Flag when total value exceeds the high-value threshold."""
-        if req.price is not None and req.quantity is not None:
-            total = req.price * req.quantity
-            if total > HIGH_VALUE_THRESHOLD:
-                return (
-                    f"Total value ₹{total:,.2f} exceeds high-value "
-                    f"threshold (₹{HIGH_VALUE_THRESHOLD:,.0f})"
-                )
-        return None
-
-    @staticmethod
-    def _check_elevated_total_value(
-        req: RequisitionDTO, _score: float,
-    ) -> Optional[str]:
-        """Flag when total is above elevated but below high threshold."""
-        if req.price is not None and req.quantity is not None:
-            total = req.price * req.quantity
-            if ELEVATED_VALUE_THRESHOLD < total <= HIGH_VALUE_THRESHOLD:
-                return (
-                    f"Total value ₹{total:,.2f} exceeds elevated "
-                    f"threshold (₹{ELEVATED_VALUE_THRESHOLD:,.0f})"
-                )
-        return None
-
-    @staticmethod
-    def _check_high_unit_price(
-        req: RequisitionDTO, _score: float,
-    ) -> Optional[str]:
-        """Flag when the unit price alone is unusually high."""
-        if req.price is not None and req.price > UNIT_PRICE_THRESHOLD:
-            return (
-                f"Unit price ₹{req.price:,.2f} exceeds historical "
-                f"threshold (₹{UNIT_PRICE_THRESHOLD:,.0f})"
-            )
-        return None
-
-    @staticmethod
-    def _check_high_quantity(
-        req: RequisitionDTO, _score: float,
-    ) -> Optional[str]:
-        """Flag when order quantity is above the plant-average threshold."""
-        if req.quantity is not None and req.quantity > QUANTITY_THRESHOLD:
-            return (
-                f"Quantity {req.quantity:,.0f} exceeds plant average "
-                f"threshold ({QUANTITY_THRESHOLD:,.0f})"
-            )
-        return None
-
-    @staticmethod
-    def _check_high_risk_material(
-        req: RequisitionDTO, _score: float,
-    ) -> Optional[str]:
-        """Flag materials that belong to a high-risk category."""
-        if req.material:
-            material_upper = req.material.upper()
-            for keyword in HIGH_RISK_MATERIALS:
-                if keyword in material_upper:
-                    return (
-                        f"Material '{req.material}' classified as "
-                        f"high-risk category"
-                    )
-        return None
-
-    @staticmethod
-    def _check_restricted_plant(
-        req: RequisitionDTO, _score: float,
-    ) -> Optional[str]:
-        """Flag requisitions originating from restricted plants."""
-        if req.plant:
-            plant_upper = req.plant.upper()
-            for restricted in RESTRICTED_PLANTS:
-                if restricted in plant_upper:
-                    return (
-                        f"Requisition from restricted plant '{req.plant}'"
-                    )
-        return None
-
-    @staticmethod
-    def _check_missing_price(
-        req: RequisitionDTO, _score: float,
-    ) -> Optional[str]:
-        """Flag when price data is absent (limits risk assessment accuracy)."""
-        if req.price is None:
-            return "Unit price data missing — unable to fully assess risk"
-        return None
-
-    @staticmethod
-    def _check_missing_quantity(
-        req: RequisitionDTO, _score: float,
-    ) -> Optional[str]:
-        """Flag when quantity data is absent."""
-        if req.quantity is None:
-            return "Quantity data missing — unable to fully assess risk"
-        return None
+# Module-level entry point, mirroring risk_scoring.score
+explain = RiskExplanationEngine.explain
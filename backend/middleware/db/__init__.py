@@ -2,7 +2,14 @@
 Database layer — SQLAlchemy engine, session management, and ORM models.
 """
 
-from .session import engine, SessionLocal, get_db
+from .session import engine, SessionLocal, ReadSessionLocal, get_db
 from .models import Base, ERPSimulatedRequisition
 
-__all__ = ["engine", "SessionLocal", "get_db", "Base", "ERPSimulatedRequisition"]
+__all__ = [
+    "engine",
+    "SessionLocal",
+    "ReadSessionLocal",
+    "get_db",
+    "Base",
+    "ERPSimulatedRequisition",
+]
@@ -10,7 +10,7 @@ Using SQLAlchemy 2.0+ style with mapped_column.
 import uuid
 from datetime import datetime
 
-from sqlalchemy import String, Float, DateTime, Text, Index
+from sqlalchemy import String, Float, DateTime, Text, Index, Uuid
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from sqlalchemy.sql import func
 
@@ -20,6 +20,10 @@ class Base(DeclarativeBase):
     pass
 
 
+# mapped_column() options for ApprovalDecision's enriched SAP fields
+_ENRICHED = {"deferred": True, "deferred_group": "enriched"}
+
+
 # ---------------------------------------------------------------------------
 # Requisition snapshot — cached copy of ERP data
 # ---------------------------------------------------------------------------
@@ -82,17 +86,20 @@ class ApprovalDecision(Base):
 
     __tablename__ = "approval_decisions"
 
-    # Primary key: UUID for distributed system compatibility  
+    # Primary key: UUID for distributed system compatibility.  Stored as a
+    # native 16-byte uuid on PostgreSQL (CHAR(32) elsewhere) rather than
+    # 36 chars of text; as_uuid=False keeps it a plain str in Python.
+    # Existing tables are converted at startup (db/schema.py).
     id: Mapped[str] = mapped_column(
-        String(36),
+        Uuid(as_uuid=False),
         primary_key=True,
         default=lambda: str(uuid.uuid4()),
         nullable=False,
     )
 
-    # ERP reference (indexed for lookups)
+    # ERP reference (indexed with state — see ix_approval_decision_erp_state)
     erp_requisition_id: Mapped[str] = mapped_column(
-        String(50), nullable=False, index=True
+        String(50), nullable=False
     )
 
     # Risk assessment
@@ -109,12 +116,11 @@ class ApprovalDecision(Base):
         comment="auto_approve | manual_approve | reject | hold",
     )
 
-    # Lifecycle state (indexed for efficient querying pending commits)
+    # Lifecycle state (leads the pending-commit and listing composites)
     state: Mapped[str] = mapped_column(
         String(20),
         nullable=False,
         default="detected",
-        index=True,
         comment="detected | pending_commit | cancelled | committed | failed",
     )
 
@@ -127,33 +133,37 @@ class ApprovalDecision(Base):
     comment: Mapped[str | None] = mapped_column(Text)
 
     # --- Enriched SAP requisition fields ---
-    product_name: Mapped[str | None] = mapped_column(String(255))
-    material_code: Mapped[str | None] = mapped_column(String(100))
-    material_group: Mapped[str | None] = mapped_column(String(50))
-    quantity: Mapped[float | None] = mapped_column(Float)
-    unit: Mapped[str | None] = mapped_column(String(10))
-    unit_price: Mapped[float | None] = mapped_column(Float)
-    total_amount: Mapped[float | None] = mapped_column(Float)
-    currency: Mapped[str | None] = mapped_column(String(5))
-    plant: Mapped[str | None] = mapped_column(String(20))
-    company_code: Mapped[str | None] = mapped_column(String(20))
-    purchasing_group: Mapped[str | None] = mapped_column(String(20))
-    created_by: Mapped[str | None] = mapped_column(String(100))
-    supplier: Mapped[str | None] = mapped_column(String(50))
-    release_status: Mapped[str | None] = mapped_column(String(10))
-    processing_status: Mapped[str | None] = mapped_column(String(10))
-    is_deleted: Mapped[bool | None] = mapped_column(default=False)
-    is_closed: Mapped[bool | None] = mapped_column(default=False)
-    creation_date: Mapped[str | None] = mapped_column(String(30))
-    delivery_date: Mapped[str | None] = mapped_column(String(30))
+    # Written once at detection and not read back by anything yet (GET
+    # /decisions selects only the core columns).  Deferred as one group so
+    # loading a decision as an entity (scheduler sweep, approve/reject/undo)
+    # leaves these wide columns out; touching any one loads the whole group.
+    product_name: Mapped[str | None] = mapped_column(String(255), **_ENRICHED)
+    material_code: Mapped[str | None] = mapped_column(String(100), **_ENRICHED)
+    material_group: Mapped[str | None] = mapped_column(String(50), **_ENRICHED)
+    quantity: Mapped[float | None] = mapped_column(Float, **_ENRICHED)
+    unit: Mapped[str | None] = mapped_column(String(10), **_ENRICHED)
+    unit_price: Mapped[float | None] = mapped_column(Float, **_ENRICHED)
+    total_amount: Mapped[float | None] = mapped_column(Float, **_ENRICHED)
+    currency: Mapped[str | None] = mapped_column(String(5), **_ENRICHED)
+    plant: Mapped[str | None] = mapped_column(String(20), **_ENRICHED)
+    company_code: Mapped[str | None] = mapped_column(String(20), **_ENRICHED)
+    purchasing_group: Mapped[str | None] = mapped_column(String(20), **_ENRICHED)
+    created_by: Mapped[str | None] = mapped_column(String(100), **_ENRICHED)
+    supplier: Mapped[str | None] = mapped_column(String(50), **_ENRICHED)
+    release_status: Mapped[str | None] = mapped_column(String(10), **_ENRICHED)
+    processing_status: Mapped[str | None] = mapped_column(String(10), **_ENRICHED)
+    is_deleted: Mapped[bool | None] = mapped_column(default=False, **_ENRICHED)
+    is_closed: Mapped[bool | None] = mapped_column(default=False, **_ENRICHED)
+    creation_date: Mapped[str | None] = mapped_column(String(30), **_ENRICHED)
+    delivery_date: Mapped[str | None] = mapped_column(String(30), **_ENRICHED)
 
     # Commit tracking
     committed_at: Mapped[datetime | None] = mapped_column(DateTime)
     error_message: Mapped[str | None] = mapped_column(Text)
 
-    # Audit timestamps
+    # Audit timestamps (indexed for the analytics daily-trend range scan)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, server_default=func.now(), nullable=False
+        DateTime, server_default=func.now(), nullable=False, index=True
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime,
@@ -205,12 +215,11 @@ class ERPSimulatedRequisition(Base):
     currency: Mapped[str | None] = mapped_column(String(5))
     plant: Mapped[str | None] = mapped_column(String(20))
 
-    # ERP status tracking
+    # ERP status tracking (leads ix_erp_req_status_created)
     status: Mapped[str] = mapped_column(
         String(20),
         nullable=False,
         default="pending",
-        index=True,
         comment="pending | approved | rejected | cancelled",
     )
 
@@ -247,8 +256,9 @@ class NotificationLog(Base):
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
 
+    # Leads ix_notification_erp_id_created, which serves plain lookups too
     erp_requisition_id: Mapped[str] = mapped_column(
-        String(50), nullable=False, index=True
+        String(50), nullable=False
     )
 
     decision: Mapped[str] = mapped_column(
@@ -286,9 +296,55 @@ class NotificationLog(Base):
 # ---------------------------------------------------------------------------
 # Composite indexes for query optimization
 # ---------------------------------------------------------------------------
-# Index for finding pending commits that are ready
+# Index for "does this requisition have an active decision" and the
+# approve/reject/undo lookups (erp_requisition_id = ? AND state IN (...));
+# its leading column also serves lookups by erp_requisition_id alone
+Index(
+    "ix_approval_decision_erp_state",
+    ApprovalDecision.erp_requisition_id,
+    ApprovalDecision.state,
+)
+
+# Index for finding pending commits that are ready.  Carrying the id lets
+# PostgreSQL answer the scheduler's sweep with an index-only scan; rows
+# are then loaded one at a time as they're processed.
 Index(
     "ix_approval_decision_pending_commits",
     ApprovalDecision.state,
     ApprovalDecision.commit_at,
+    postgresql_include=["id"],
+)
+
+# Index for MockERPAdapter's "WHERE status = 'pending' ORDER BY created_at"
+Index(
+    "ix_erp_req_status_created",
+    ERPSimulatedRequisition.status,
+    ERPSimulatedRequisition.created_at,
+)
+
+# Indexes matching GET /decisions and GET /notifications: equality filter
+# then "ORDER BY created_at DESC ... LIMIT", served without a sort
+Index(
+    "ix_approval_decision_state_created",
+    ApprovalDecision.state,
+    ApprovalDecision.created_at.desc(),
+)
+Index(
+    "ix_notification_channel_created",
+    NotificationLog.channel,
+    NotificationLog.created_at.desc(),
+)
+Index(
+    "ix_notification_erp_id_created",
+    NotificationLog.erp_requisition_id,
+    NotificationLog.created_at.desc(),
+)
+
+# Covering index for the analytics summary aggregate: decision counts and
+# risk-score buckets/average read only these two columns, so PostgreSQL can
+# answer it with an index-only scan instead of reading the wide heap rows
+Index(
+    "ix_approval_decision_decision_risk",
+    ApprovalDecision.decision,
+    ApprovalDecision.risk_score,
 )
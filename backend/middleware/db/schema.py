@@ -0,0 +1,144 @@
+"""
+Startup schema creation with a DDL fingerprint.
+
+``Base.metadata.create_all`` probes every table (and index) for existence
+on each call — one catalog round-trip apiece — even when nothing changed
+since the last start.  ``ensure_schema`` hashes the DDL the models would
+emit, keeps that hash in a one-row ``_schema_version`` table, and skips
+``create_all`` when it matches and every model table is still present
+(one table-name listing, compared against the metadata).
+
+Like ``create_all`` itself this only ever *adds* missing tables/indexes;
+it is not a migration tool.  The few in-place upgrades an existing table
+needs are listed in ``_UPGRADES``, run before ``create_all`` and folded
+into the fingerprint, so adding one forces the next start through them.
+A table dropped by hand is noticed by the presence check and recreated;
+an index dropped by hand is not.
+"""
+
+import hashlib
+import logging
+
+from sqlalchemy import (
+    Column,
+    MetaData,
+    String,
+    Table,
+    Uuid,
+    delete,
+    func,
+    inspect,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+logger = logging.getLogger(__name__)
+
+# Kept out of Base.metadata so drop_all/create_all never touch it
+_version_metadata = MetaData()
+_schema_version = Table(
+    "_schema_version",
+    _version_metadata,
+    Column("fingerprint", String(64), primary_key=True),
+)
+
+
+def _upgrade_decision_ids(conn: Connection) -> None:
+    """
+    Convert ``approval_decisions.id`` from VARCHAR(36) to the Uuid type.
+
+    PostgreSQL gets a native ``uuid`` column, so the varchar is altered in
+    place.  Backends without a native type store Uuid as 32 hex chars, so
+    the hyphens are stripped from existing ids to match what the column
+    now binds.  Both steps are no-ops once applied.
+    """
+    inspector = inspect(conn)
+    if not inspector.has_table("approval_decisions"):
+        return
+
+    dialect = conn.dialect
+    if dialect.name == "postgresql":
+        id_type = next(
+            col["type"]
+            for col in inspector.get_columns("approval_decisions")
+            if col["name"] == "id"
+        )
+        if not isinstance(id_type, Uuid):
+            logger.info("Converting approval_decisions.id to uuid")
+            conn.execute(text(
+                "ALTER TABLE approval_decisions "
+                "ALTER COLUMN id TYPE uuid USING id::uuid"
+            ))
+    elif not dialect.supports_native_uuid:
+        decisions = Table("approval_decisions", MetaData(), Column("id", String))
+        result = conn.execute(
+            update(decisions)
+            .where(decisions.c.id.contains("-"))
+            .values(id=func.replace(decisions.c.id, "-", ""))
+        )
+        if result.rowcount:
+            logger.info("Stripped hyphens from %d decision ids", result.rowcount)
+    else:
+        logger.warning(
+            "approval_decisions.id not converted on %s; "
+            "convert it to the native uuid type by hand", dialect.name,
+        )
+
+
+# Idempotent upgrades for tables create_all won't touch, run in order
+_UPGRADES = (_upgrade_decision_ids,)
+
+
+def schema_fingerprint(metadata: MetaData, conn: Connection) -> str:
+    """
+    SHA-256 of the CREATE TABLE / CREATE INDEX DDL for ``conn``'s dialect,
+    plus the names of the in-place upgrades.
+    """
+    dialect = conn.dialect
+    digest = hashlib.sha256()
+    for upgrade in _UPGRADES:
+        digest.update(upgrade.__name__.encode())
+    for table in metadata.sorted_tables:
+        digest.update(str(CreateTable(table).compile(dialect=dialect)).encode())
+        for index in sorted(table.indexes, key=lambda i: i.name or ""):
+            digest.update(str(CreateIndex(index).compile(dialect=dialect)).encode())
+    return digest.hexdigest()
+
+
+def ensure_schema(bind: Engine, metadata: MetaData) -> bool:
+    """
+    Create missing tables unless the stored fingerprint matches and every
+    table in ``metadata`` exists.
+
+    Returns:
+        True if ``create_all`` ran, False if it was skipped.
+    """
+    with bind.begin() as conn:
+        fingerprint = schema_fingerprint(metadata, conn)
+
+        existing = set(inspect(conn).get_table_names())
+        missing = [
+            table.name
+            for table in metadata.tables.values()
+            if table.name not in existing
+        ]
+        if missing:
+            logger.info("Missing tables %s — running create_all", missing)
+        elif _schema_version.name in existing:
+            stored = conn.execute(
+                select(_schema_version.c.fingerprint).limit(1)
+            ).scalar()
+            if stored == fingerprint:
+                logger.info("Schema fingerprint unchanged — skipping create_all")
+                return False
+
+        for upgrade in _UPGRADES:
+            upgrade(conn)
+        metadata.create_all(bind=conn)
+        _version_metadata.create_all(bind=conn)
+        conn.execute(delete(_schema_version))
+        conn.execute(_schema_version.insert().values(fingerprint=fingerprint))
+        return True
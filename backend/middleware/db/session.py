@@ -4,13 +4,18 @@ SQLAlchemy session factory and engine configuration.
 Provides:
     - engine           — global SQLAlchemy engine (connection pool)
     - SessionLocal     — scoped session factory
+    - ReadSessionLocal — thread-local session for short read-only paths
     - get_db()         — FastAPI dependency that yields a DB session
 """
 
 from collections.abc import Generator
 
+from typing import Any
+
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import scoped_session, sessionmaker, Session
+from sqlalchemy.pool import NullPool, StaticPool
 
 from config import get_settings
 
@@ -19,12 +24,36 @@ settings = get_settings()
 # ---------------------------------------------------------------------------
 # Engine — single connection pool shared across the application
 # ---------------------------------------------------------------------------
+def _engine_options(url: str) -> dict[str, Any]:
+    """Pool settings for the configured backend."""
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite":
+        # Local dev / tests: no server connection worth pooling.  Sessions
+        # move between the event loop and worker threads, so drop
+        # sqlite3's same-thread check; an in-memory DB must keep its one
+        # connection or every checkout would see a fresh empty database.
+        in_memory = parsed.database in (None, "", ":memory:")
+        return {
+            "connect_args": {"check_same_thread": False},
+            "poolclass": StaticPool if in_memory else NullPool,
+        }
+    return {
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        # Hand out the most recently returned connection: a quiet period
+        # leaves the surplus idle (and recycled) instead of every pooled
+        # connection going stale and paying the pre-ping/reconnect cost
+        "pool_use_lifo": True,
+    }
+
+
 engine = create_engine(
     settings.get_database_url(),
     echo=settings.debug,        # SQL logging in dev mode
-    pool_pre_ping=True,         # verify connections before use
-    pool_size=10,
-    max_overflow=20,
+    **_engine_options(settings.get_database_url()),
 )
 
 # ---------------------------------------------------------------------------
@@ -36,6 +65,19 @@ SessionLocal = sessionmaker(
     bind=engine,
 )
 
+# Read-only hot paths (adapter polling, health probes) reuse one Session
+# object per thread instead of building a new one per call.  It shares the
+# engine's connection pool; ``with ReadSessionLocal() as db`` returns the
+# connection to the pool on exit.  Keep writes on SessionLocal().
+ReadSessionLocal = scoped_session(
+    sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        expire_on_commit=False,
+        bind=engine,
+    )
+)
+
 
 # ---------------------------------------------------------------------------
 # FastAPI dependency
@@ -5,7 +5,7 @@ User model for JWT authentication.
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Column, String, DateTime
+from sqlalchemy import Column, String, DateTime, Index
 from db.models import Base
 
 
@@ -13,9 +13,19 @@ class User(Base):
     """Application user for authentication."""
 
     __tablename__ = "users"
+    __table_args__ = (
+        # Unique lookup index for login; on PostgreSQL it also carries the
+        # columns login reads, so the lookup is an index-only scan
+        Index(
+            "ix_users_username",
+            "username",
+            unique=True,
+            postgresql_include=["id", "hashed_password", "full_name", "role"],
+        ),
+    )
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    username = Column(String(100), unique=True, nullable=False, index=True)
+    username = Column(String(100), nullable=False)
     hashed_password = Column(String(255), nullable=False)
     full_name = Column(String(200), nullable=False, default="")
     role = Column(String(50), nullable=False, default="approver")  # approver | admin
@@ -0,0 +1,48 @@
+"""
+Gunicorn configuration — picked up automatically by ``gunicorn main:app``
+when started from this directory.
+
+Runs a few Uvicorn workers (one event loop per process) while making
+sure exactly one of them commits
+decisions to the ERP: every worker runs the APScheduler job, but only
+the holder of an exclusive flock on ``SCHEDULER_LOCK_FILE`` acts on it
+(see ``scheduler.worker``).  The lock dies with its holder, so after a
+crash, respawn or HUP reload a live worker takes over on its next tick.
+
+Each worker has its own DB connection pool (DB_POOL_SIZE + DB_MAX_OVERFLOW
+connections), so the worker count defaults to 2 rather than scaling with
+cores; raise ``WEB_CONCURRENCY`` only as far as the database's connection
+limit allows.  Schema setup — and the DEMO_MODE table reset — runs once
+in the master before any worker is forked.
+"""
+
+import os
+import tempfile
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+worker_class = "uvicorn.workers.UvicornWorker"
+workers = int(os.environ.get("WEB_CONCURRENCY", "2"))
+
+
+def on_starting(server):
+    # Runs in the master before any fork, so every worker inherits it; one
+    # file per master keeps separate deployments on a host apart
+    os.environ.setdefault(
+        "SCHEDULER_LOCK_FILE",
+        os.path.join(tempfile.gettempdir(), f"asap-scheduler-{os.getpid()}.lock"),
+    )
+
+    # Workers inherit the imported app, and their lifespan skips this step
+    from db import engine
+    from main import prepare_database
+
+    prepare_database()
+    engine.dispose()  # no pooled connections may cross the fork
+    os.environ["DB_PREPARED"] = "1"
+
+
+def on_exit(server):
+    try:
+        os.remove(os.environ["SCHEDULER_LOCK_FILE"])
+    except OSError:
+        pass
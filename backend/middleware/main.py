@@ -5,24 +5,31 @@ Single-service FastAPI application.
 
 Startup sequence:
     1. Load configuration from .env
-    2. Create database tables (dev only — use Alembic in prod)
+    2. Create database tables (dev only — use Alembic in prod) and
+       idempotently seed the simulated ERP requisitions
     3. Start background scheduler
     4. Mount API routes
     5. Serve with Uvicorn
 
 Run:
     uvicorn main:app --reload          # development
-    uvicorn main:app --host 0.0.0.0    # production-like
+    gunicorn main:app                  # production (see gunicorn.conf.py)
 """
 
 import logging
+import os
 from contextlib import asynccontextmanager
 
+import orjson
+from anyio import to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response
 
+from adapters.mock_adapter import seed_simulated_requisitions
 from config import get_settings
 from db import Base, engine
+from db.schema import ensure_schema
 from scheduler import start_scheduler, shutdown_scheduler, init_adapter
 from api import router as api_router
 from api.auth_routes import router as auth_router
@@ -39,37 +46,66 @@ logging.basicConfig(
     level=logging.DEBUG if settings.debug else logging.INFO,
     format="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
 )
+# Per-request lines are DEBUG (uvicorn's access log already records each
+# request); in production, don't print tracebacks for broken log handlers
+logging.raiseExceptions = not settings.is_production
 logger = logging.getLogger(__name__)
 
 
 # ---------------------------------------------------------------------------
 # Application lifespan (startup / shutdown hooks)
 # ---------------------------------------------------------------------------
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """
-    Runs once on startup — and the code after `yield` runs on shutdown.
-    Replaces the deprecated @app.on_event("startup") / ("shutdown") pattern.
-    """
-    # ---- STARTUP ----
-    logger.info("Starting %s (env=%s)", settings.app_name, settings.app_env)
-
-    # Create tables if they don't exist (idempotent operation)
+def prepare_database() -> None:
+    """Create (or, in demo mode, recreate) the tables and seed the mock ERP."""
     try:
         logger.info("Ensuring database tables exist (creating if needed)")
         if settings.demo_mode:
-            # In demo mode, drop and recreate so schema changes take effect
+            # In demo mode, drop and recreate so schema changes take effect.
+            # One transaction on one connection (atomic on PostgreSQL's
+            # transactional DDL), and no per-table existence probes on the
+            # create side since every table was just dropped.
             logger.warning("DEMO_MODE enabled — dropping and recreating all tables")
-            Base.metadata.drop_all(bind=engine)
-        Base.metadata.create_all(bind=engine)
+            with engine.begin() as conn:
+                Base.metadata.drop_all(bind=conn)
+                Base.metadata.create_all(bind=conn, checkfirst=False)
+        else:
+            ensure_schema(engine, Base.metadata)
+        seed_simulated_requisitions(engine)
         logger.info("Database tables ready")
     except Exception as exc:
         logger.warning("Database table creation failed: %s", exc)
 
-    # Always initialize ERP adapter (needed for /detect endpoint)
-    init_adapter()
 
-    # Start background commit worker (only if auto-commit enabled)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Runs once on startup — and the code after `yield` runs on shutdown.
+    Replaces the deprecated @app.on_event("startup") / ("shutdown") pattern.
+    """
+    # ---- STARTUP ----
+    logger.info("Starting %s (env=%s)", settings.app_name, settings.app_env)
+
+    # Sync routes and their get_db dependency run on AnyIO's worker threads;
+    # the default 40 tokens stall requests under load before the DB pool does
+    to_thread.current_default_thread_limiter().total_tokens = (
+        settings.api_threadpool_size
+    )
+
+    # Create tables if they don't exist (idempotent operation).  The DDL
+    # and seeding are blocking DB round-trips, so run them on a worker
+    # thread rather than stalling the event loop.  Under gunicorn the
+    # master has already done this once before forking (gunicorn.conf.py),
+    # so a demo-mode reset doesn't repeat in every worker or respawn.
+    if os.environ.get("DB_PREPARED") != "1":
+        await to_thread.run_sync(prepare_database)
+
+    # Always initialize ERP adapter (needed for /detect endpoint); connecting
+    # may be an HTTP round-trip to SAP, so it also runs off the loop
+    await to_thread.run_sync(init_adapter)
+
+    # Start background commit worker (only if auto-commit enabled).  Under
+    # gunicorn every worker runs it, but only the one holding the commit
+    # lock submits anything (see scheduler.worker._holds_scheduler_lock).
     if settings.auto_commit_enabled:
         start_scheduler()
         logger.info("Auto-commit scheduler started")
@@ -95,6 +131,7 @@ app = FastAPI(
     ),
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Mount API routes under /api/v1
@@ -116,10 +153,15 @@ app.add_middleware(
 # ---------------------------------------------------------------------------
 # Root endpoint (convenience)
 # ---------------------------------------------------------------------------
+# Constant body, serialized once: the root URL is what uptime probes hit,
+# and a plain dict return would go through jsonable_encoder every time
+_ROOT_BODY = orjson.dumps({
+    "service": settings.app_name,
+    "version": "0.1.0",
+    "docs": "/docs",
+})
+
+
 @app.get("/", tags=["root"])
-def root():
-    return {
-        "service": settings.app_name,
-        "version": "0.1.0",
-        "docs": "/docs",
-    }
+async def root():
+    return Response(_ROOT_BODY, media_type="application/json")
@@ -10,13 +10,14 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RequisitionDTO:
     """
     Normalised purchase requisition — adapter output / core engine input.
 
     Adapters convert ERP-specific formats into this DTO before
-    handing data to the core engine.
+    handing data to the core engine.  Instances are immutable and
+    slotted (no per-instance ``__dict__``) since one is built per row.
     """
     erp_requisition_id: str
     item_number: Optional[str] = None
@@ -44,10 +45,13 @@ class RequisitionDTO:
     delivery_date: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DecisionDTO:
     """
     Approval decision — core engine output / persistence input.
+
+    Immutable and slotted like RequisitionDTO; derive an updated copy
+    with ``dataclasses.replace`` (e.g. to mark it committed).
     """
     erp_requisition_id: str
     risk_score: float = 0.0
@@ -6,9 +6,20 @@ Keep them separate from internal domain models and ORM models.
 """
 
 from datetime import datetime
+from typing import Any, Literal
+
 from pydantic import BaseModel, Field
 
 
+# ---------------------------------------------------------------------------
+# Enumerated query values (validated by membership, published as enums)
+# ---------------------------------------------------------------------------
+
+ERPMode = Literal["mock", "sap", "hybrid"]
+DecisionState = Literal["detected", "pending_commit", "committed", "cancelled", "failed"]
+NotificationChannel = Literal["email", "slack"]
+
+
 # ---------------------------------------------------------------------------
 # Health
 # ---------------------------------------------------------------------------
@@ -108,7 +119,12 @@ class ApprovalDecisionOut(BaseModel):
 
 
 class DecisionListResponse(BaseModel):
-    """Response for GET /decisions."""
+    """
+    Response for GET /decisions.
+
+    Documents the body for OpenAPI only: the route streams the page as
+    JSON straight from the selected columns, without building models.
+    """
     decisions: list[ApprovalDecisionOut]
     total: int
 
@@ -144,6 +160,24 @@ class ApproveRejectResponse(BaseModel):
     message: str
 
 
+class ERPApprovalItem(BaseModel):
+    """One decision in a POST /approvals:batch request."""
+    requisition_id: str
+    decision: str = Field(examples=["approve"])
+    comment: str = ""
+
+
+class ERPBatchApprovalRequest(BaseModel):
+    """Request body for POST /approvals:batch."""
+    items: list[ERPApprovalItem] = Field(min_length=1)
+
+
+class ERPBatchApprovalResponse(BaseModel):
+    """Response for POST /approvals:batch — one ERP payload per item."""
+    results: list[dict[str, Any]]
+    total: int
+
+
 # ---------------------------------------------------------------------------
 # Notifications
 # ---------------------------------------------------------------------------
@@ -162,6 +196,8 @@ class NotificationLogOut(BaseModel):
 
 
 class NotificationListResponse(BaseModel):
-    """Response for GET /notifications."""
+    """
+    Response for GET /notifications (streamed like DecisionListResponse).
+    """
     notifications: list[NotificationLogOut]
     total: int
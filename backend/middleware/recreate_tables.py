@@ -1,12 +1,17 @@
 """
 Utility script to drop and recreate all database tables.
 USE ONLY IN DEVELOPMENT - this will delete all data!
+
+Pass ``--seed`` to also insert the simulated ERP sample requisitions.
 """
 
+import sys
+
+from adapters.mock_adapter import seed_simulated_requisitions
 from db.models import Base
 from db.session import engine
 
-def recreate_tables():
+def recreate_tables(seed: bool = False):
     """Drop all tables and recreate them from the current ORM models."""
     print("Dropping all tables...")
     Base.metadata.drop_all(bind=engine)
@@ -18,5 +23,9 @@ def recreate_tables():
     tables = list(Base.metadata.tables.keys())
     print(f"\nTables created: {', '.join(tables)}")
 
+    if seed:
+        seed_simulated_requisitions(engine)
+        print("✅ Simulated ERP requisitions seeded")
+
 if __name__ == "__main__":
-    recreate_tables()
+    recreate_tables(seed="--seed" in sys.argv[1:])
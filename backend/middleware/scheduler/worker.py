@@ -14,18 +14,17 @@ Improvements over the original implementation:
 """
 
 import logging
+import os
 from datetime import datetime
 
 from apscheduler.schedulers.background import BackgroundScheduler
-from sqlalchemy import select
 
 from adapters.base import ERPAdapter
 from adapters.mock_adapter import MockERPAdapter
-from adapters.sap_adapter import SAPERPAdapter
 from config import get_settings
 from db.models import ApprovalDecision
 from db.session import SessionLocal
-from services.orchestrator import ApprovalOrchestrator
+from services.orchestrator import get_orchestrator
 from services.notification_service import NotificationService
 
 logger = logging.getLogger(__name__)
@@ -55,7 +54,7 @@ class CommitWorker:
     _ACCEPTED_ERP_STATUSES = frozenset({"ok", "simulated"})
 
     def __init__(self) -> None:
-        self.orchestrator = ApprovalOrchestrator()
+        self.orchestrator = get_orchestrator()
         self.notification_service = NotificationService()
 
     def run(self, adapter: ERPAdapter) -> dict[str, int]:
@@ -91,21 +90,21 @@ class CommitWorker:
 
         with SessionLocal() as db:
             try:
-                pending_decisions = self.orchestrator.list_pending_commits(db)
-                stats["total"] = len(pending_decisions)
+                pending_ids = self.orchestrator.list_pending_commit_ids(db)
+                stats["total"] = len(pending_ids)
 
-                if not pending_decisions:
+                if not pending_ids:
                     logger.info("CommitWorker: no decisions ready for commit")
                     return stats
 
                 logger.info(
-                    "CommitWorker: found %d candidate(s)", len(pending_decisions),
+                    "CommitWorker: found %d candidate(s)", len(pending_ids),
                 )
 
-                for decision in pending_decisions:
+                for decision_id in pending_ids:
                     try:
                         committed = self._process_single_decision(
-                            decision=decision,
+                            decision_id=decision_id,
                             adapter=adapter,
                             db=db,
                         )
@@ -117,10 +116,12 @@ class CommitWorker:
                     except Exception as exc:
                         logger.error(
                             "CommitWorker: decision %s failed — %s",
-                            decision.id,
+                            decision_id,
                             exc,
                         )
-                        self._mark_as_failed(decision, exc)
+                        decision = db.get(ApprovalDecision, decision_id)
+                        if decision is not None:
+                            self._mark_as_failed(decision, exc)
                         stats["failed"] += 1
 
                 db.commit()
@@ -145,7 +146,7 @@ class CommitWorker:
 
     def _process_single_decision(
         self,
-        decision: ApprovalDecision,
+        decision_id: str,
         adapter: ERPAdapter,
         db,
     ) -> bool:
@@ -156,23 +157,27 @@ class CommitWorker:
         Raises:
             Exception: propagated when ERP submission hard-fails.
         """
-        req_id = decision.erp_requisition_id
-
         # ── 1. Double-commit guard ──────────────────────────────────
-        # Re-read from DB inside the same session to guard against race
-        # conditions when two scheduler ticks overlap.
-        fresh = db.execute(
-            select(ApprovalDecision).where(ApprovalDecision.id == decision.id)
-        ).scalar_one_or_none()
+        # Load the full row only now, straight from the DB and row-locked,
+        # to guard against overlapping scheduler ticks and a concurrent
+        # direct push (POST /approvals:batch) settling it first.
+        decision = db.get(
+            ApprovalDecision,
+            decision_id,
+            populate_existing=True,
+            with_for_update=True,
+        )
 
-        if fresh is None or fresh.state != "pending_commit":
+        if decision is None or decision.state != "pending_commit":
             logger.warning(
                 "CommitWorker: decision %s no longer pending_commit (state=%s) — skipping",
-                decision.id,
-                fresh.state if fresh else "DELETED",
+                decision_id,
+                decision.state if decision else "DELETED",
             )
             return False
 
+        req_id = decision.erp_requisition_id
+
         logger.info(
             "CommitWorker: ▸ processing  id=%s  req=%s  decision=%s",
             decision.id,
@@ -263,6 +268,45 @@ _scheduler: BackgroundScheduler | None = None
 _commit_worker: CommitWorker | None = None
 _adapter: ERPAdapter | None = None
 
+# Under gunicorn every worker runs the scheduler, but only the one holding
+# an exclusive flock on SCHEDULER_LOCK_FILE (set by gunicorn.conf.py)
+# commits.  The kernel drops the lock when its holder exits for any
+# reason — crash, respawn, HUP reload — and another live worker picks it
+# up on its next tick.  Without the variable (a lone uvicorn process)
+# this process always commits.
+_scheduler_lock_fd: int | None = None
+
+
+def _holds_scheduler_lock() -> bool:
+    """Take the commit lock if it is free; True while this process holds it."""
+    global _scheduler_lock_fd
+
+    lock_path = os.environ.get("SCHEDULER_LOCK_FILE")
+    if not lock_path or _scheduler_lock_fd is not None:
+        return True
+
+    import fcntl  # POSIX-only, like gunicorn itself
+
+    fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        os.close(fd)
+        return False
+
+    _scheduler_lock_fd = fd
+    logger.info("Took the commit lock (pid=%d)", os.getpid())
+    return True
+
+
+def _release_scheduler_lock() -> None:
+    """Give up the commit lock so another worker can take it."""
+    global _scheduler_lock_fd
+
+    if _scheduler_lock_fd is not None:
+        os.close(_scheduler_lock_fd)
+        _scheduler_lock_fd = None
+
 
 def _commit_job() -> None:
     """
@@ -281,6 +325,10 @@ def _commit_job() -> None:
         logger.warning("CommitWorker or adapter not initialized — skipping")
         return
 
+    if not _holds_scheduler_lock():
+        logger.debug("Another worker holds the commit lock — skipping")
+        return
+
     try:
         # Ensure adapter is connected (safe call, no private attribute access)
         try:
@@ -316,6 +364,7 @@ def init_adapter() -> None:
         logger.info("Using MockERPAdapter (erp_mode=mock, MySQL-backed)")
         _adapter = MockERPAdapter()
     elif settings.erp_mode == "sap":
+        from adapters.sap_adapter import SAPERPAdapter
         logger.info("Using SAPERPAdapter (erp_mode=sap)")
         _adapter = SAPERPAdapter()
     elif settings.erp_mode == "hybrid":
@@ -381,6 +430,7 @@ def shutdown_scheduler() -> None:
     if _scheduler and _scheduler.running:
         _scheduler.shutdown(wait=False)
         logger.info("Scheduler shut down")
+    _release_scheduler_lock()
 
     if _adapter:
         try:
@@ -4,7 +4,7 @@ Services layer — business orchestration.
 Coordinates between adapters, core engines, and persistence.
 """
 
-from .orchestrator import ApprovalOrchestrator
+from .orchestrator import ApprovalOrchestrator, get_orchestrator
 from .notification_service import NotificationService
 
-__all__ = ["ApprovalOrchestrator", "NotificationService"]
+__all__ = ["ApprovalOrchestrator", "NotificationService", "get_orchestrator"]
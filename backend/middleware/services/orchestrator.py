@@ -13,6 +13,7 @@ It owns the workflow:
 import logging
 import uuid
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any
 
 from sqlalchemy import select
@@ -20,7 +21,7 @@ from sqlalchemy.orm import Session
 
 from adapters.base import ERPAdapter
 from core.risk_scoring import RiskScoringEngine
-from core.risk_explanation import RiskExplanationEngine
+from core.risk_explanation import RiskExplanationEngine, score_and_explain
 from db.models import ApprovalDecision
 from models.domain import RequisitionDTO
 from config import get_settings
@@ -60,6 +61,11 @@ class ApprovalOrchestrator:
     ) -> None:
         self.risk_engine = risk_engine or RiskScoringEngine()
         self.explanation_engine = explanation_engine or RiskExplanationEngine()
+        # The stock engines fuse into one pass over each requisition;
+        # injected ones are called separately
+        self._use_fused_assessment = (
+            risk_engine is None and explanation_engine is None
+        )
         self.settings = get_settings()
 
     # ------------------------------------------------------------------
@@ -119,18 +125,13 @@ class ApprovalOrchestrator:
                     )
                     continue
 
-                # Compute risk score
-                risk_score = self.risk_engine.score(requisition)
+                # Compute risk score and human-readable explanation
+                risk_score, risk_explanation = self._assess_risk(requisition)
                 logger.debug(
                     "Risk score for %s: %.2f",
                     requisition.erp_requisition_id,
                     risk_score,
                 )
-
-                # Generate human-readable risk explanation
-                risk_explanation = self.explanation_engine.explain(
-                    requisition, risk_score,
-                )
                 logger.debug(
                     "Risk explanation for %s: %s",
                     requisition.erp_requisition_id,
@@ -314,6 +315,34 @@ class ApprovalOrchestrator:
 
         return list(decisions)
 
+    def list_pending_commit_ids(self, db: Session) -> list[str]:
+        """
+        Ids of the decisions ``list_pending_commits`` would return.
+
+        Reads only the covering (state, commit_at) INCLUDE (id) index, so
+        the scheduler's sweep doesn't fetch wide rows it may never touch.
+
+        Args:
+            db: SQLAlchemy session
+
+        Returns:
+            Decision ids ordered by commit_at.
+        """
+        stmt = (
+            select(ApprovalDecision.id)
+            .where(ApprovalDecision.state == "pending_commit")
+            .where(ApprovalDecision.commit_at <= datetime.utcnow())
+            .order_by(ApprovalDecision.commit_at)
+        )
+        decision_ids = list(db.execute(stmt).scalars())
+
+        logger.info(
+            "Found %d decisions ready for commit (grace period expired)",
+            len(decision_ids),
+        )
+
+        return decision_ids
+
     # ------------------------------------------------------------------
     # 4. Manual Approve / Reject
     # ------------------------------------------------------------------
@@ -424,6 +453,113 @@ class ApprovalOrchestrator:
             db.rollback()
             return None
 
+    def approve_decisions_bulk(
+        self,
+        erp_requisition_ids: list[str],
+        db: Session,
+        comment: str | None = None,
+    ) -> list[ApprovalDecision | None]:
+        """
+        Manually approve many pending requisitions in one transaction.
+
+        Same transition as ``approve_decision`` for each ID, but all
+        pending rows are loaded with one locking SELECT and committed once.
+
+        Returns:
+            One entry per input ID (in order): the updated ApprovalDecision,
+            or None if that ID had no pending decision.
+
+        Raises:
+            Exception: If the commit fails (the session is rolled back).
+        """
+        note = (
+            f"Approved: {comment}" if comment else "Manually approved by manager"
+        )
+        return self._resolve_decisions_bulk(
+            erp_requisition_ids, db, "manual_approve", note,
+        )
+
+    def reject_decisions_bulk(
+        self,
+        erp_requisition_ids: list[str],
+        db: Session,
+        comment: str | None = None,
+    ) -> list[ApprovalDecision | None]:
+        """
+        Manually reject many pending requisitions in one transaction.
+
+        Bulk counterpart of ``reject_decision``; see
+        ``approve_decisions_bulk`` for the return and error contract.
+        """
+        note = (
+            f"Rejected: {comment}" if comment else "Manually rejected by manager"
+        )
+        return self._resolve_decisions_bulk(
+            erp_requisition_ids, db, "reject", note,
+        )
+
+    def submit_directly(
+        self,
+        adapter: ERPAdapter,
+        items: list[tuple[str, str, str]],
+        db: Session,
+    ) -> list[dict[str, Any]]:
+        """
+        Push decisions straight to the ERP, bypassing the grace period.
+
+        Pending decisions for the same requisitions are row-locked first
+        (the commit worker locks them too, so it can't submit one
+        concurrently) and settled in the same transaction once the ERP
+        has answered: an item the ERP accepted — or reports as already
+        processed — marks them ``committed`` with the pushed decision, so
+        the commit worker never releases the requisition a second time.
+        Items the adapter reports as ``error`` leave them pending.
+
+        Args:
+            adapter: ERP adapter instance (must be connected)
+            items: ``(requisition_id, decision, comment)`` tuples.
+            db: SQLAlchemy session
+
+        Returns:
+            The adapter's per-item payloads, in input order.
+
+        Raises:
+            Exception: If the ERP call or the commit fails (the session
+                is rolled back).
+        """
+        try:
+            pending = self._lock_pending_decisions(
+                [requisition_id for requisition_id, _, _ in items], db,
+            )
+            results = adapter.submit_approvals(items)
+
+            now = datetime.utcnow()
+            settled = 0
+            for (requisition_id, decision_value, _comment), result in zip(items, results):
+                if result.get("status") == "error":
+                    continue
+                for decision in pending.pop(requisition_id, ()):
+                    decision.decision = decision_value
+                    decision.state = "committed"
+                    decision.committed_at = now
+                    decision.comment = (
+                        f"{decision.comment or ''} | Submitted directly to ERP".strip(" |")
+                    )
+                    settled += 1
+
+            db.commit()
+        except Exception as exc:
+            logger.error("Direct ERP submission failed: %s", exc)
+            db.rollback()
+            raise
+
+        logger.info(
+            "Submitted %d item(s) directly to ERP; settled %d pending decision(s)",
+            len(items),
+            settled,
+        )
+        return results
+
     # ------------------------------------------------------------------
     # Private Helper Methods
     # ------------------------------------------------------------------
@@ -449,6 +585,84 @@ class ApprovalOrchestrator:
             )
         return decision
 
+    def _resolve_decisions_bulk(
+        self,
+        erp_requisition_ids: list[str],
+        db: Session,
+        outcome: str,
+        note: str,
+    ) -> list[ApprovalDecision | None]:
+        """Commit ``outcome`` on the latest pending decision of each ID."""
+        logger.info(
+            "Resolving %d decisions as %s", len(erp_requisition_ids), outcome,
+        )
+
+        # Newest first per ID, consumed one per occurrence so a repeated ID
+        # behaves like repeated single calls would
+        pending = self._lock_pending_decisions(erp_requisition_ids, db)
+
+        now = datetime.utcnow()
+        resolved: list[ApprovalDecision | None] = []
+        for erp_id in erp_requisition_ids:
+            candidates = pending.get(erp_id)
+            if not candidates:
+                logger.warning("No pending decision found for %s", erp_id)
+                resolved.append(None)
+                continue
+
+            decision = candidates.pop(0)
+            decision.decision = outcome
+            decision.state = "committed"
+            decision.committed_at = now
+            decision.comment = f"{decision.comment or ''} | {note}".strip(" |")
+            resolved.append(decision)
+
+        try:
+            db.commit()
+        except Exception as exc:
+            logger.error("Failed to resolve decisions as %s: %s", outcome, exc)
+            db.rollback()
+            raise
+
+        logger.info(
+            "Resolved %d/%d decisions as %s",
+            sum(d is not None for d in resolved),
+            len(erp_requisition_ids),
+            outcome,
+        )
+        return resolved
+
+    @staticmethod
+    def _lock_pending_decisions(
+        erp_requisition_ids: list[str],
+        db: Session,
+    ) -> dict[str, list[ApprovalDecision]]:
+        """
+        Load and row-lock the pending decisions of the given IDs.
+
+        Returns:
+            ID → its pending decisions, newest first.
+        """
+        stmt = (
+            select(ApprovalDecision)
+            .where(ApprovalDecision.erp_requisition_id.in_(set(erp_requisition_ids)))
+            .where(ApprovalDecision.state.in_(["pending_commit", "detected"]))
+            .order_by(ApprovalDecision.created_at.desc())
+            .with_for_update()
+        )
+
+        pending: dict[str, list[ApprovalDecision]] = {}
+        for decision in db.scalars(stmt):
+            pending.setdefault(decision.erp_requisition_id, []).append(decision)
+        return pending
+
+    def _assess_risk(self, requisition: RequisitionDTO) -> tuple[float, str]:
+        """Return ``(risk_score, risk_explanation)`` for a requisition."""
+        if self._use_fused_assessment:
+            return score_and_explain(requisition)
+        risk_score = self.risk_engine.score(requisition)
+        return risk_score, self.explanation_engine.explain(requisition, risk_score)
+
     def _has_active_decision(
         self,
         erp_requisition_id: str,
@@ -518,3 +732,15 @@ class ApprovalOrchestrator:
             return f"Medium risk (score: {risk_score:.2f}) — requires approval"
         else:
             return f"High risk (score: {risk_score:.2f}) — flagged for review"
+
+
+@lru_cache
+def get_orchestrator() -> ApprovalOrchestrator:
+    """
+    Process-wide orchestrator singleton.
+
+    ApprovalOrchestrator and its risk engines hold no per-request state
+    (the DB session is passed into each call), so routes and the scheduler
+    share one instance instead of building one per request.
+    """
+    return ApprovalOrchestrator()
@@ -0,0 +1,37 @@
+"""
+Shared fixtures.
+
+Settings and the engine are built at import, so the environment is
+pointed at a throwaway SQLite database before any app module loads.
+"""
+
+import os
+import tempfile
+
+_tmp_dir = tempfile.mkdtemp(prefix="asap-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_tmp_dir, 'asap.db')}"
+os.environ["ERP_MODE"] = "mock"
+os.environ["DEBUG"] = "false"
+os.environ["DEMO_MODE"] = "false"
+os.environ["AUTO_COMMIT_ENABLED"] = "false"
+os.environ.pop("DB_PREPARED", None)
+os.environ.pop("SCHEDULER_LOCK_FILE", None)
+
+import pytest
+from fastapi.testclient import TestClient
+
+from core.auth import create_access_token
+
+
+@pytest.fixture(scope="session")
+def client():
+    import main
+
+    with TestClient(main.app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def auth_headers() -> dict[str, str]:
+    token = create_access_token({"sub": "tester", "role": "approver"})
+    return {"Authorization": f"Bearer {token}"}
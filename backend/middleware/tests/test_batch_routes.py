@@ -0,0 +1,103 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import select
+
+from db import SessionLocal
+from db.models import ApprovalDecision
+
+
+def _add_pending(*erp_ids: str, state: str = "pending_commit") -> None:
+    with SessionLocal() as db:
+        db.add_all(
+            ApprovalDecision(
+                erp_requisition_id=erp_id,
+                decision="hold",
+                state=state,
+                commit_at=datetime.utcnow() + timedelta(minutes=5),
+            )
+            for erp_id in erp_ids
+        )
+        db.commit()
+
+
+def _decisions(erp_id: str) -> list[tuple[str, str]]:
+    with SessionLocal() as db:
+        return db.execute(
+            select(ApprovalDecision.decision, ApprovalDecision.state)
+            .where(ApprovalDecision.erp_requisition_id == erp_id)
+        ).all()
+
+
+def test_batch_approve(client, auth_headers):
+    _add_pending("BA-1")
+    _add_pending("BA-2", state="detected")
+
+    r = client.post(
+        "/api/v1/batch/approve",
+        headers=auth_headers,
+        json={"ids": ["BA-1", "BA-MISSING", "BA-2"], "comment": "ok"},
+    )
+
+    assert r.status_code == 200
+    assert r.json() == {
+        "processed": 2,
+        "failed": 1,
+        "results": [
+            {"erp_requisition_id": "BA-1", "success": True, "message": "Approved"},
+            {
+                "erp_requisition_id": "BA-MISSING",
+                "success": False,
+                "message": "No pending decision found",
+            },
+            {"erp_requisition_id": "BA-2", "success": True, "message": "Approved"},
+        ],
+    }
+    assert _decisions("BA-1") == [("manual_approve", "committed")]
+    assert _decisions("BA-2") == [("manual_approve", "committed")]
+
+
+def test_batch_reject(client, auth_headers):
+    _add_pending("BR-1")
+
+    r = client.post(
+        "/api/v1/batch/reject", headers=auth_headers, json={"ids": ["BR-1"]},
+    )
+
+    assert r.status_code == 200
+    assert r.json()["processed"] == 1
+    assert _decisions("BR-1") == [("reject", "committed")]
+
+
+def test_batch_repeated_id_resolves_one_decision_per_occurrence(client, auth_headers):
+    _add_pending("BD-1")
+
+    r = client.post(
+        "/api/v1/batch/reject",
+        headers=auth_headers,
+        json={"ids": ["BD-1", "BD-1"]},
+    )
+
+    assert [item["success"] for item in r.json()["results"]] == [True, False]
+
+
+def test_batch_already_committed_is_not_resolved_again(client, auth_headers):
+    _add_pending("BC-1", state="committed")
+
+    r = client.post(
+        "/api/v1/batch/approve", headers=auth_headers, json={"ids": ["BC-1"]},
+    )
+
+    assert r.json()["failed"] == 1
+    assert _decisions("BC-1") == [("hold", "committed")]
+
+
+def test_batch_empty_ids_rejected(client, auth_headers):
+    r = client.post("/api/v1/batch/approve", headers=auth_headers, json={"ids": []})
+
+    assert r.status_code == 400
+
+
+def test_batch_requires_auth(client):
+    r = client.post("/api/v1/batch/approve", json={"ids": ["BA-1"]})
+
+    assert r.status_code in (401, 403)
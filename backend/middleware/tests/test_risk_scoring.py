@@ -0,0 +1,64 @@
+from itertools import product
+
+import pytest
+
+from core.risk_explanation import RiskExplanationEngine, score_and_explain
+from core.risk_scoring import RiskScoringEngine, score
+from models.domain import RequisitionDTO
+
+_PRICES = (None, 0.0, 10.0, 15.0, 15.01, 40.0)
+_QUANTITIES = (None, 1.0, 3.0, 5.0, 6.0, 10.0)
+_MATERIALS = (None, "", "MAT-001", "hazmat-drum", "Chemical X")
+_PLANTS = (None, "1010", "defense-plant", "NUCLEAR")
+
+
+def _req(price, quantity, material=None, plant=None) -> RequisitionDTO:
+    return RequisitionDTO(
+        erp_requisition_id="PR-TEST",
+        price=price,
+        quantity=quantity,
+        material=material,
+        plant=plant,
+    )
+
+
+@pytest.mark.parametrize(
+    "price,quantity,material,plant",
+    list(product(_PRICES, _QUANTITIES, _MATERIALS, _PLANTS)),
+)
+def test_score_and_explain_matches_separate_calls(price, quantity, material, plant):
+    req = _req(price, quantity, material, plant)
+    risk = RiskScoringEngine().score(req)
+
+    assert score_and_explain(req) == (risk, RiskExplanationEngine.explain(req, risk))
+    assert 0.0 <= risk <= 100.0
+
+
+@pytest.mark.parametrize(
+    "price,quantity,material,plant,expected",
+    [
+        (10.0, 2.0, "MAT-001", "1010", 0.0),      # 20 total, nothing fires
+        (10.0, 4.0, None, None, 10.0),            # 40 total → moderate
+        (20.0, 4.0, None, None, 35.0),            # 80 → elevated, price anomaly
+        (20.0, 10.0, None, None, 65.0),           # 200 → high, price, quantity
+        (None, None, None, None, 10.0),           # both fields missing
+        (40.0, 10.0, "HAZMAT", "DEFENSE", 100.0),  # 110 points, capped
+    ],
+)
+def test_score_values(price, quantity, material, plant, expected):
+    assert score(_req(price, quantity, material, plant)) == expected
+
+
+def test_explanation_lists_each_fired_rule():
+    _, explanation = score_and_explain(_req(20.0, 10.0, "toxic waste", "1010"))
+
+    reasons = explanation.split("; ")
+    assert len(reasons) == 4
+    assert reasons[0].startswith("Total value ₹200.00 exceeds high-value")
+    assert "classified as high-risk category" in reasons[3]
+
+
+def test_all_clear_explanation():
+    assert score_and_explain(_req(10.0, 2.0)) == (
+        0.0, "All parameters within normal operational thresholds",
+    )
@@ -0,0 +1,85 @@
+import pytest
+from sqlalchemy import create_engine, inspect, select, text
+from sqlalchemy.orm import Session
+
+import scheduler.worker as worker
+from db.models import ApprovalDecision, Base
+from db.schema import ensure_schema
+
+_OLD_ID = "12345678-1234-1234-1234-123456789abc"
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'schema.db'}")
+    yield engine
+    engine.dispose()
+
+
+def test_ensure_schema_skips_when_unchanged(engine):
+    assert ensure_schema(engine, Base.metadata) is True
+    assert ensure_schema(engine, Base.metadata) is False
+
+
+def test_ensure_schema_recreates_dropped_table(engine):
+    ensure_schema(engine, Base.metadata)
+    with engine.begin() as conn:
+        conn.execute(text("DROP TABLE approval_decisions"))
+
+    assert ensure_schema(engine, Base.metadata) is True
+    assert "approval_decisions" in inspect(engine).get_table_names()
+
+
+def test_ensure_schema_upgrades_varchar_decision_ids(engine):
+    # approval_decisions as it was before ids became Uuid
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE approval_decisions "
+            "(id VARCHAR(36) PRIMARY KEY, erp_requisition_id VARCHAR(50))"
+        ))
+        conn.execute(text(
+            f"INSERT INTO approval_decisions VALUES ('{_OLD_ID}', 'PR-OLD')"
+        ))
+
+    assert ensure_schema(engine, Base.metadata) is True
+
+    with Session(engine) as db:
+        assert db.execute(text("SELECT id FROM approval_decisions")).scalar() == (
+            _OLD_ID.replace("-", "")
+        )
+        assert db.execute(
+            select(ApprovalDecision.erp_requisition_id)
+            .where(ApprovalDecision.id == _OLD_ID)
+        ).scalar() == "PR-OLD"
+
+
+@pytest.fixture
+def lock_file(tmp_path, monkeypatch):
+    path = tmp_path / "scheduler.lock"
+    monkeypatch.setenv("SCHEDULER_LOCK_FILE", str(path))
+    worker._release_scheduler_lock()
+    yield path
+    worker._release_scheduler_lock()
+
+
+def test_scheduler_lock_elects_one_holder(lock_file):
+    fcntl = pytest.importorskip("fcntl")
+
+    # Another worker holds the lock
+    other = lock_file.open("w")
+    fcntl.flock(other, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    assert worker._holds_scheduler_lock() is False
+
+    # ...until it exits
+    other.close()
+    assert worker._holds_scheduler_lock() is True
+    assert worker._holds_scheduler_lock() is True
+
+    with lock_file.open("w") as contender, pytest.raises(BlockingIOError):
+        fcntl.flock(contender, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+
+def test_scheduler_lock_unset_always_holds(monkeypatch):
+    monkeypatch.delenv("SCHEDULER_LOCK_FILE", raising=False)
+
+    assert worker._holds_scheduler_lock() is True